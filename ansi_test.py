@@ -1,46 +1,77 @@
+import os
+import shutil
 import sys
 import time
 
 
 class StatusDisplay:
-    def __init__(self, lines=4):
+    """Status lines pinned to the top of the terminal above scrolling output.
+
+    The status rows are kept out of the terminal's scroll region, so they
+    stay in place while regular prints scroll below them. Each update is
+    compared with the previous frame: only changed lines are rewritten,
+    starting at their first changed character, and the whole frame goes
+    out in a single write.
+    """
+
+    def __init__(self, lines=4, stream=None):
         self.lines = lines
+        self.stream = stream or sys.stdout
+        self._frame = [None] * lines  # What is on screen now; None if unknown
         self.setup()
 
     def setup(self):
-        # Reserve space at top
-        for _ in range(self.lines):
-            print()
-        # Move cursor back up
-        sys.stdout.write(f'\033[{self.lines}A')
-        sys.stdout.flush()
+        self.width, self.height = shutil.get_terminal_size()
+        # Clear the screen, leave the top rows out of the scroll region and
+        # start regular output below them
+        self.stream.write(f'\033[2J\033[{self.lines + 1};{self.height}r'
+                          f'\033[{self.lines + 1};1H')
+        self.stream.flush()
+        self._frame = [None] * self.lines
 
     def update_status(self, status_text):
-        # Save cursor position
-        sys.stdout.write('\033[s')
-        # Move to top
-        sys.stdout.write(f'\033[{self.lines}A')
-        # Clear the status area
-        for _ in range(self.lines):
-            sys.stdout.write('\033[2K\033[1B')
-        # Move back to top
-        sys.stdout.write(f'\033[{self.lines}A')
-        # Write new status
-        print(status_text)
-        # Restore cursor position
-        sys.stdout.write('\033[u')
-        sys.stdout.flush()
+        new_frame = [line[:self.width] for line in status_text.split("\n")[:self.lines]]
+        new_frame += [""] * (self.lines - len(new_frame))
+
+        parts = []
+        for row, (old, new) in enumerate(zip(self._frame, new_frame)):
+            if old == new:
+                continue
+            # Skip the start of the line that is already on screen
+            column = len(os.path.commonprefix((old, new))) if old is not None else 0
+            parts.append(f'\033[{row + 1};{column + 1}H{new[column:]}')
+            if old is None or len(new) < len(old):
+                parts.append('\033[K')  # Clear what the old line left behind
+        self._frame = new_frame
+
+        if parts:
+            # Save and restore the cursor so regular output continues where it was
+            self.stream.write('\033[s' + ''.join(parts) + '\033[u')
+            self.stream.flush()
+
+    def redraw(self):
+        """Repaint every status line on the next update, e.g. after a resize"""
+        self.setup()
+
+    def close(self):
+        # Give the whole screen back to scrolling output
+        self.stream.write(f'\033[r\033[{self.height};1H\n')
+        self.stream.flush()
 
 
 # Usage
-status = StatusDisplay(3)
-for i in range(50):
-    # Update persistent status
-    status.update_status(
-        f"Current step: {i}\nItems processed: {i*5}\nErrors: {i//10}")
+if __name__ == "__main__":
+    status = StatusDisplay(3)
+    try:
+        for i in range(50):
+            # Update persistent status
+            status.update_status(
+                f"Current step: {i}\nItems processed: {i*5}\nErrors: {i//10}")
 
-    # Regular prints
-    print(f"Working on item {i}...")
-    print(f"  Details about item {i}")
+            # Regular prints
+            print(f"Working on item {i}...")
+            print(f"  Details about item {i}")
 
-    time.sleep(0.3)
+            time.sleep(0.3)
+    finally:
+        status.close()
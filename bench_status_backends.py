@@ -0,0 +1,281 @@
+"""Benchmark the cost of every status display in this repo on the same workload.
+
+Each backend runs in its own process whose terminal is a pseudo-terminal
+owned by this script, so every byte it writes is counted without a real
+terminal being involved. The workload is N steps of M status updates
+followed by K log lines each. Live-based displays additionally get a
+forced refresh every `--frame-every` updates, standing in for their
+refresh tick.
+
+Results are printed as a table and appended to bench_results.jsonl so
+regressions show up between runs.
+"""
+import argparse
+import curses
+import fcntl
+import importlib
+import json
+import logging
+import os
+import pty
+import resource
+import struct
+import subprocess
+import sys
+import tempfile
+import termios
+import time
+
+BACKENDS = ["simple_panel", "richtest5", "richtest6",
+            "top_status", "ansi", "curses"]
+RESULTS_FILE = "bench_results.jsonl"
+TERMINAL_SIZE = (40, 100)  # rows, columns
+
+
+class FrameMeter:
+    """Counts frames and the CPU time the calling thread spends drawing them"""
+
+    def __init__(self):
+        self.frames = 0
+        self.cpu = 0.0
+
+    def wrap(self, draw):
+        def frame(*args, **kwargs):
+            start = time.thread_time()
+            try:
+                return draw(*args, **kwargs)
+            finally:
+                self.cpu += time.thread_time() - start
+                self.frames += 1
+        return frame
+
+
+# Workloads, run inside the child process
+
+
+def _bench_tracker(module_name, steps, updates, logs, frame_every):
+    from log_setup import setup_logging
+    module = importlib.import_module(module_name)
+    setup_logging(log_file=os.devnull)
+    log = logging.getLogger("rich")
+    meter = FrameMeter()
+
+    with module.StatusTracker() as status:
+        status.live.refresh = meter.wrap(status.live.refresh)
+        status.set_total_steps(steps)
+        start = time.perf_counter()
+        for s in range(steps):
+            status.start_step(f"Step {s}")
+            for u in range(updates):
+                if hasattr(status, "update_step_data"):
+                    status.update_step_data(lines_processed=u)
+                else:
+                    # The simple panel has no step data, so re-set the total instead
+                    status.set_total_steps(steps)
+                if u % frame_every == 0:
+                    status.live.refresh()
+            for k in range(logs):
+                log.info(f"Step {s}: log line {k}")
+            status.complete_step()
+        wall = time.perf_counter() - start
+    return wall, meter
+
+
+def _bench_top_status(steps, updates, logs, frame_every):
+    from rich.live import Live
+    from richtest_2 import TopStatusDisplay
+    display = TopStatusDisplay()
+    meter = FrameMeter()
+
+    with Live(display.get_layout(), refresh_per_second=4, screen=True) as live:
+        live.refresh = meter.wrap(live.refresh)
+        start = time.perf_counter()
+        for s in range(steps):
+            for u in range(updates):
+                display.update_status(operation=f"Step {s}", processed=u)
+                live.update(display.get_layout())
+                if u % frame_every == 0:
+                    live.refresh()
+            for k in range(logs):
+                display.log(f"Step {s}: log line {k}")
+        wall = time.perf_counter() - start
+    return wall, meter
+
+
+def _bench_ansi(steps, updates, logs, frame_every):
+    from ansi_test import StatusDisplay
+    display = StatusDisplay(3)
+    meter = FrameMeter()
+    # Every update repaints the status lines, so each one is a frame
+    update_status = meter.wrap(display.update_status)
+
+    start = time.perf_counter()
+    for s in range(steps):
+        for u in range(updates):
+            update_status(f"Current step: {s}\nItems processed: {u}\nErrors: 0")
+        for k in range(logs):
+            print(f"Step {s}: log line {k}")
+    wall = time.perf_counter() - start
+    display.close()
+    return wall, meter
+
+
+def _bench_curses(steps, updates, logs, frame_every):
+    import curses_test
+    meter = FrameMeter()
+    iterations = steps * updates
+
+    # The curses loop redraws (and logs two lines) once per iteration
+    start = time.perf_counter()
+    cpu = time.thread_time()
+    curses.wrapper(curses_test.main, iterations=iterations, delay=0)
+    meter.cpu = time.thread_time() - cpu
+    meter.frames = iterations
+    return time.perf_counter() - start, meter
+
+
+def run_child(backend, steps, updates, logs, frame_every, result_file):
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    cpu_before = time.process_time()
+    if backend == "simple_panel":
+        wall, meter = _bench_tracker(
+            "simple_status_tracker_panel", steps, updates, logs, frame_every)
+    elif backend in ("richtest5", "richtest6"):
+        wall, meter = _bench_tracker(backend, steps, updates, logs, frame_every)
+    elif backend == "top_status":
+        wall, meter = _bench_top_status(steps, updates, logs, frame_every)
+    elif backend == "ansi":
+        wall, meter = _bench_ansi(steps, updates, logs, frame_every)
+    else:
+        wall, meter = _bench_curses(steps, updates, logs, frame_every)
+
+    result = {
+        "updates_per_sec": steps * updates / wall,
+        "wall_s": wall,
+        "cpu_s": time.process_time() - cpu_before,
+        "frames": meter.frames,
+        "cpu_per_frame_ms": meter.cpu / meter.frames * 1000 if meter.frames else None,
+        # ru_maxrss is in kilobytes on Linux
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "rss_growth_mb": (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024,
+    }
+    with open(result_file, "w") as f:
+        json.dump(result, f)
+
+
+# Parent side
+
+
+def run_in_pty(backend, args):
+    """Run one backend in a child process on a pseudo-terminal and collect its results"""
+    master, slave = pty.openpty()
+    rows, columns = TERMINAL_SIZE
+    fcntl.ioctl(slave, termios.TIOCSWINSZ,
+                struct.pack("HHHH", rows, columns, 0, 0))
+    with tempfile.NamedTemporaryFile(suffix=".json", delete=False) as f:
+        result_file = f.name
+
+    env = {**os.environ, "TERM": "xterm-256color",
+           "LINES": str(rows), "COLUMNS": str(columns)}
+    command = [sys.executable, os.path.abspath(__file__), "--child", backend,
+               "--steps", str(args.steps), "--updates", str(args.updates),
+               "--logs", str(args.logs), "--frame-every", str(args.frame_every),
+               "--result-file", result_file]
+    proc = subprocess.Popen(command, stdin=slave, stdout=slave, stderr=slave,
+                            env=env, cwd=os.path.dirname(os.path.abspath(__file__)))
+    os.close(slave)
+
+    # Drain the terminal until the child exits, counting what it wrote
+    bytes_written = 0
+    output_tail = b""
+    while True:
+        try:
+            data = os.read(master, 65536)
+        except OSError:  # EIO once the child has closed the terminal
+            break
+        if not data:
+            break
+        bytes_written += len(data)
+        output_tail = (output_tail + data)[-2000:]
+    os.close(master)
+    proc.wait()
+
+    try:
+        with open(result_file) as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        raise RuntimeError(f"{backend} benchmark failed:\n"
+                           f"{output_tail.decode(errors='replace')}")
+    finally:
+        os.remove(result_file)
+
+    result["bytes_written"] = bytes_written
+    result["bytes_per_frame"] = bytes_written / result["frames"] if result["frames"] else None
+    return result
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--steps", type=int, default=20, help="N steps")
+    parser.add_argument("--updates", type=int, default=500,
+                        help="M status updates per step")
+    parser.add_argument("--logs", type=int, default=20,
+                        help="K log lines per step")
+    parser.add_argument("--frame-every", type=int, default=100,
+                        help="Force a Live refresh every this many updates")
+    parser.add_argument("--backends", nargs="+",
+                        choices=BACKENDS, default=BACKENDS)
+    parser.add_argument("--results-file", default=RESULTS_FILE)
+    parser.add_argument("--child", choices=BACKENDS, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.steps, args.updates, args.logs,
+                  args.frame_every, args.result_file)
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    results = {backend: run_in_pty(backend, args) for backend in args.backends}
+
+    table = Table(title=f"{args.steps} steps × {args.updates} updates, "
+                        f"{args.logs} log lines per step")
+    for column in ("backend", "updates/sec", "frames", "CPU/frame",
+                   "bytes/frame", "peak RSS"):
+        table.add_column(column, justify="left" if column == "backend" else "right")
+    for backend, result in results.items():
+        cpu_per_frame = result["cpu_per_frame_ms"]
+        bytes_per_frame = result["bytes_per_frame"]
+        table.add_row(
+            backend,
+            f"{result['updates_per_sec']:,.0f}",
+            f"{result['frames']:,}",
+            f"{cpu_per_frame:.3f}ms" if cpu_per_frame is not None else "-",
+            f"{bytes_per_frame:,.0f}" if bytes_per_frame is not None else "-",
+            f"{result['peak_rss_mb']:.1f}MB",
+        )
+    Console().print(table)
+
+    with open(args.results_file, "a") as f:
+        f.write(json.dumps({
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "revision": _git_revision(),
+            "workload": {"steps": args.steps, "updates": args.updates,
+                         "logs": args.logs, "frame_every": args.frame_every},
+            "results": results,
+        }) + "\n")
+    print(f"Results appended to {args.results_file}")
+
+
+if __name__ == "__main__":
+    main()
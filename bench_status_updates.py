@@ -0,0 +1,115 @@
+import io
+import threading
+import time
+
+import rich
+from rich.console import Console
+
+from richtest5 import StatusTracker
+import richtest6
+
+DURATION = 2.0  # Seconds to hammer update_step_data for each variant
+THREADS = 32
+INCREMENTS_PER_THREAD = 20_000
+
+
+class EagerStatusTracker(StatusTracker):
+    """The previous behaviour: rebuild and push the panel on every update"""
+
+    def _update_display(self):
+        if self.live:
+            self.live.update(self._create_status_panel())
+
+
+def run(tracker_class):
+    """Call update_step_data in a tight loop and return updates/sec"""
+    updates = 0
+    with tracker_class() as status:
+        status.set_total_steps(1)
+        status.start_step("Benchmark")
+        start = time.perf_counter()
+        end = start + DURATION
+        while time.perf_counter() < end:
+            for _ in range(1000):
+                updates += 1
+                status.update_step_data(lines_processed=updates)
+        elapsed = time.perf_counter() - start
+        status.complete_step()
+    return updates / elapsed
+
+
+def run_counter(tracker_class):
+    """Add to a counter handle in a tight loop; return (adds/sec, ns per add)"""
+    with tracker_class() as status:
+        status.set_total_steps(1)
+        status.start_step("Benchmark")
+        lines = status.counter("lines_processed")
+        adds = 0
+        start = time.perf_counter()
+        end = start + DURATION
+        while time.perf_counter() < end:
+            for _ in range(1000):
+                lines.add(1)
+            adds += 1000
+        elapsed = time.perf_counter() - start
+        status.complete_step()
+    assert status.step_data["Benchmark"]["lines_processed"] == adds
+    return adds / elapsed, elapsed / adds * 1e9
+
+
+def run_threads(concurrent):
+    """Have THREADS threads add to one counter; return (increments/sec, lost increments)"""
+    with richtest6.StatusTracker(concurrent=concurrent, mode="rich") as status:
+        status.set_total_steps(1)
+        status.start_step("Benchmark")
+
+        def worker():
+            for _ in range(INCREMENTS_PER_THREAD):
+                status.add_step_data(lines_processed=1)
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        status.complete_step()
+
+    expected = THREADS * INCREMENTS_PER_THREAD
+    counted = status.step_data["Benchmark"]["lines_processed"]
+    return expected / elapsed, expected - counted
+
+
+def main():
+    # Render into a fake terminal so the numbers don't depend on the real one
+    rich.reconfigure(file=io.StringIO(), force_terminal=True, width=100)
+
+    baseline = {"dict_key": 0}
+    start = time.perf_counter()
+    for i in range(1_000_000):
+        baseline["dict_key"] = i
+    dict_rate = 1_000_000 / (time.perf_counter() - start)
+
+    eager_rate = run(EagerStatusTracker)
+    lazy_rate = run(StatusTracker)
+    counter_rate, counter_ns = run_counter(StatusTracker)
+
+    shared_rate, shared_lost = run_threads(concurrent=False)
+    sharded_rate, sharded_lost = run_threads(concurrent=True)
+
+    console = Console()
+    console.print(f"dict key assignment:      {dict_rate:>14,.0f} ops/sec")
+    console.print(f"before (eager rebuild):   {eager_rate:>14,.0f} updates/sec")
+    console.print(f"after (render scheduler): {lazy_rate:>14,.0f} updates/sec")
+    console.print(f"speedup: {lazy_rate / eager_rate:,.0f}x")
+    console.print(f"counter handle add():     {counter_rate:>14,.0f} adds/sec "
+                  f"({counter_ns:.0f}ns each)")
+    console.print(f"\n{THREADS} threads, shared dict:    {shared_rate:>14,.0f} increments/sec, "
+                  f"{shared_lost:,} lost")
+    console.print(f"{THREADS} threads, concurrent mode: {sharded_rate:>14,.0f} increments/sec, "
+                  f"{sharded_lost:,} lost")
+
+
+if __name__ == "__main__":
+    main()
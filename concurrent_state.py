@@ -0,0 +1,97 @@
+import itertools
+import threading
+
+
+class StepCounter:
+    """Handle for one step data counter, for tight loops.
+
+    add() is a single integer add: nothing is formatted, locked or
+    rendered. The tracker reads `value` on its render tick. A handle must
+    only be used by one thread; take one handle per thread and the tracker
+    sums them.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def add(self, amount=1):
+        self.value += amount
+
+
+class _Shard:
+    """One thread's private share of the step data"""
+
+    def __init__(self):
+        self.values = {}  # step name -> {key: (sequence number, value)}
+        self.counts = {}  # step name -> {key: running total}
+
+
+class ShardedStepData:
+    """Step data written per thread without locking and merged on read.
+
+    Each thread writes only to its own shard, so updates from many threads
+    never contend. The lock is only taken once per thread to register its
+    shard and when a reader collects the shards. Set values carry a global
+    sequence number so the latest write wins across threads; counters are
+    summed.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()  # next() is atomic in CPython
+
+    def _shard(self):
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = _Shard()
+            with self._lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+            return shard
+
+    def set(self, step_name, data):
+        """Set values for a step; the most recent write from any thread wins"""
+        seq = next(self._sequence)
+        values = self._shard().values.setdefault(step_name, {})
+        for key, value in data.items():
+            values[key] = (seq, value)
+
+    def add(self, step_name, increments):
+        """Add to counters for a step"""
+        counts = self._shard().counts.setdefault(step_name, {})
+        for key, amount in increments.items():
+            counts[key] = counts.get(key, 0) + amount
+
+    def snapshot(self, step_name):
+        """Merge every thread's data for a step into one plain dict"""
+        with self._lock:
+            shards = list(self._shards)
+
+        latest = {}
+        totals = {}
+        for shard in shards:
+            # dict() copies in a single step, so a writer can't change it mid-read
+            for key, (seq, value) in dict(shard.values.get(step_name, {})).items():
+                if key not in latest or seq > latest[key][0]:
+                    latest[key] = (seq, value)
+            for key, amount in dict(shard.counts.get(step_name, {})).items():
+                totals[key] = totals.get(key, 0) + amount
+
+        merged = {key: value for key, (seq, value) in latest.items()}
+        for key, amount in totals.items():
+            merged[key] = merged.get(key, 0) + amount
+        return merged
+
+    def pop(self, step_name):
+        """Return the merged data for a finished step and drop it from all shards"""
+        merged = self.snapshot(step_name)
+        with self._lock:
+            for shard in self._shards:
+                shard.values.pop(step_name, None)
+                shard.counts.pop(step_name, None)
+        return merged
@@ -4,44 +4,84 @@ import threading
 from queue import Queue
 
 
-def main(stdscr):
-    curses.curs_set(0)  # Hide cursor
-    stdscr.nodelay(1)   # Non-blocking input
+class CursesStatusDisplay:
+    """Status fields above a scrolling log, redrawn incrementally.
+
+    Only status fields whose value changed are rewritten. Log lines are
+    appended to a pad holding the last `scrollback` lines instead of
+    redrawing the log, and render() hands all pending changes to the
+    terminal in one doupdate().
+    """
+
+    def __init__(self, stdscr, status_height=5, scrollback=1000):
+        self.height, self.width = stdscr.getmaxyx()
+        self.status_height = status_height
+        self.scrollback = scrollback
+        self.status_win = curses.newwin(status_height, self.width, 0, 0)
+        self.status_win.border()
+        self.log_pad = curses.newpad(scrollback, self.width)
+        self.log_pad.scrollok(True)
+        self._fields = {}  # Name -> (row, last drawn text)
+        self._log_row = 0  # Pad row the next log line goes to
+        self._status_changed = True
+        self._log_changed = False
+
+    def update_status(self, **fields):
+        for name, value in fields.items():
+            text = f"{name}: {value}"[:self.width - 2]
+            row, old = self._fields.get(name, (len(self._fields) + 1, ""))
+            if row >= self.status_height - 1:
+                continue  # No room left inside the border
+            if text != old:
+                # Pad with spaces over the old text instead of clearing the line,
+                # so the border stays untouched
+                self.status_win.addstr(row, 1, text.ljust(len(old)))
+                self._status_changed = True
+            self._fields[name] = (row, text)
 
-    # Create windows
-    height, width = stdscr.getmaxyx()
-    status_win = curses.newwin(5, width, 0, 0)
-    log_win = curses.newwin(height-5, width, 5, 0)
+    def log(self, message):
+        if self._log_row == self.scrollback:
+            self.log_pad.scroll(1)
+            self._log_row -= 1
+        self.log_pad.addnstr(self._log_row, 0, message, self.width - 1)
+        self._log_row += 1
+        self._log_changed = True
 
-    log_lines = []
+    def render(self):
+        """Copy pending changes to the screen with a single terminal update"""
+        if self._status_changed:
+            self.status_win.noutrefresh()
+        if self._log_changed:
+            visible = self.height - self.status_height
+            top = max(0, self._log_row - visible)
+            self.log_pad.noutrefresh(top, 0, self.status_height, 0,
+                                     self.height - 1, self.width - 1)
+        if self._status_changed or self._log_changed:
+            curses.doupdate()
+        self._status_changed = self._log_changed = False
+
+
+def main(stdscr, iterations=100, delay=0.2):
+    curses.curs_set(0)  # Hide cursor
+    stdscr.nodelay(1)   # Non-blocking input
+    stdscr.noutrefresh()
 
-    def add_log(message):
-        log_lines.append(message)
-        if len(log_lines) > height - 10:
-            log_lines.pop(0)
+    display = CursesStatusDisplay(stdscr)
 
     # Main loop
-    for i in range(100):
+    for i in range(iterations):
         # Update status window
-        status_win.clear()
-        status_win.addstr(0, 0, f"Status: Step {i}")
-        status_win.addstr(1, 0, f"Processed: {i*3} items")
-        status_win.addstr(2, 0, f"Time: {time.strftime('%H:%M:%S')}")
-        status_win.border()
-        status_win.refresh()
+        display.update_status(Status=f"Step {i}",
+                              Processed=f"{i*3} items",
+                              Time=time.strftime('%H:%M:%S'))
 
         # Add to log
-        add_log(f"Processing item {i}: some detailed work")
-        add_log(f"  - Completed sub-task for item {i}")
+        display.log(f"Processing item {i}: some detailed work")
+        display.log(f"  - Completed sub-task for item {i}")
 
-        # Update log window
-        log_win.clear()
-        for idx, line in enumerate(log_lines[-height+10:]):
-            if idx < height - 7:
-                log_win.addstr(idx, 0, line[:width-1])
-        log_win.refresh()
+        display.render()
 
-        time.sleep(0.2)
+        time.sleep(delay)
 
         # Check for 'q' to quit
         if stdscr.getch() == ord('q'):
@@ -0,0 +1,42 @@
+import pandas as pd
+
+
+def memory_usage(df):
+    """Bytes used by a frame, including the Python strings in object columns"""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def compact_dtypes(df, category_threshold=0.5, downcast_floats=True):
+    """Return a copy of df with smaller dtypes.
+
+    - integers are downcast to the smallest type that holds their range
+    - floats become float32 if downcast_floats (this drops precision past
+      about 7 significant digits)
+    - string columns with at most `category_threshold` distinct values per
+      row become categoricals
+
+    Columns of other types (datetimes, bools, existing categoricals) are
+    left as they are, and so are columns that can't be compacted: all-NA
+    integer columns and object columns of unhashable values such as lists.
+    """
+    columns = {}
+    for name, column in df.items():
+        if (pd.api.types.is_bool_dtype(column)
+                or isinstance(column.dtype, pd.CategoricalDtype)):
+            continue
+        if pd.api.types.is_integer_dtype(column):
+            minimum = column.min()
+            if pd.isna(minimum):
+                continue  # Empty, or a nullable column with only NA
+            columns[name] = pd.to_numeric(
+                column, downcast="unsigned" if minimum >= 0 else "integer")
+        elif pd.api.types.is_float_dtype(column) and downcast_floats:
+            columns[name] = pd.to_numeric(column, downcast="float")
+        elif pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+            try:
+                distinct = column.nunique()
+            except TypeError:
+                continue  # Unhashable values can't be categories
+            if len(column) and distinct <= category_threshold * len(column):
+                columns[name] = column.astype("category")
+    return df.assign(**columns) if columns else df.copy()
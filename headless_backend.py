@@ -0,0 +1,86 @@
+import contextlib
+import json
+import sys
+import threading
+
+
+def json_default(value):
+    """Make numpy scalars, arrays, Series and other odd values JSON-safe"""
+    if hasattr(value, "tolist") and getattr(value, "ndim", 0):
+        return value.tolist()  # Arrays and Series of any size
+    if hasattr(value, "item"):
+        try:
+            return value.item()
+        except ValueError:
+            pass
+    return str(value)
+
+
+class HeadlessBackend:
+    """Status output for non-TTY runs as compact JSON lines.
+
+    A background thread writes a snapshot of the tracker state at most once
+    every `interval` seconds, and only if something changed. Step events
+    (start/complete/error) are written immediately, one line each. No Rich
+    rendering happens at all.
+
+    While it runs everything else printed to stdout (step messages, the
+    final summary) is redirected to stderr, so stdout carries only the
+    JSON lines.
+    """
+
+    def __init__(self, tracker, stream=None, interval=5.0):
+        self.tracker = tracker
+        self.stream = stream or sys.stdout
+        self.interval = interval
+        self._write_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._redirect = None
+
+    def start(self, thread=True):
+        """Start writing snapshots; without thread, the caller calls tick()"""
+        if self.stream is sys.stdout:
+            self._redirect = contextlib.redirect_stdout(sys.stderr)
+            self._redirect.__enter__()
+        if thread:
+            self._thread = threading.Thread(
+                target=self._run, name="headless-status", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._redirect is not None:
+            self._redirect.__exit__(None, None, None)
+            self._redirect = None
+        self._write({"event": "snapshot", **self.tracker.snapshot()})
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.tick()
+
+    def tick(self):
+        """Write a snapshot if anything changed since the last one"""
+        # In headless mode nothing else consumes the tracker's dirty flag;
+        # worker processes and counter handles can't set it, so always
+        # report while there are any
+        if (self.tracker._dirty or self.tracker.progress_channels
+                or self.tracker._counters):
+            self.tracker._dirty = False
+            self._write({"event": "snapshot", **self.tracker.snapshot()})
+        # Counter progress for the journal, which otherwise sees it only at completion
+        self.tracker.emit_counters()
+
+    def event(self, record):
+        # Step data changes are covered by the snapshots
+        if record["event"] not in ("update", "add"):
+            self._write(record)
+
+    def _write(self, record):
+        line = json.dumps(record, default=json_default, separators=(",", ":"))
+        with self._write_lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
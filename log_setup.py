@@ -0,0 +1,161 @@
+from logging.handlers import QueueHandler, QueueListener
+from rich.logging import RichHandler
+import atexit
+import logging
+import queue
+import sys
+import threading
+import time
+
+_listener = None
+
+
+class BatchedFileHandler(logging.FileHandler):
+    """FileHandler that buffers formatted lines and writes them in batches.
+
+    The buffer is written out once it holds `batch_size` lines or when
+    `flush_interval` seconds have passed since the last write.
+    """
+
+    def __init__(self, filename, mode="a", batch_size=256, flush_interval=0.5):
+        # delay: the file is only opened (and truncated) once something is logged
+        super().__init__(filename, mode=mode, encoding="utf-8", delay=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_flush = time.monotonic()
+
+    def emit(self, record):
+        try:
+            self._buffer.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+            return
+        if (len(self._buffer) >= self.batch_size
+                or time.monotonic() - self._last_flush >= self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self._buffer:
+                if self.stream is None and not self._closed:
+                    self.stream = self._open()
+                if self.stream:
+                    self.stream.write("\n".join(self._buffer) + "\n")
+                self._buffer.clear()
+            self._last_flush = time.monotonic()
+            super().flush()
+        finally:
+            self.release()
+
+
+class _RecordQueueHandler(QueueHandler):
+    def prepare(self, record):
+        # The listener lives in this process, so records can be passed as-is.
+        # The default prepare() formats on the calling thread and drops
+        # exc_info, which would cost time and lose rich tracebacks.
+        return record
+
+
+class _FlushRequest:
+    """Queued by flush_logging(); the listener flushes and sets done on reaching it"""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+class _BatchingQueueListener(QueueListener):
+    def __init__(self, log_queue, *handlers, flush_interval=0.5):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block):
+        # Flush pending batches whenever the queue has been idle for a while
+        while True:
+            try:
+                return self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                for handler in self.handlers:
+                    handler.flush()
+
+    def handle(self, record):
+        if isinstance(record, _FlushRequest):
+            for handler in self.handlers:
+                handler.flush()
+            record.done.set()
+            return
+        super().handle(record)
+
+
+def setup_logging(log_file="rich_log.log", mode="w", level=logging.NOTSET,
+                  batch_size=256, flush_interval=0.5, rich_output=None):
+    """Route logging through a queue to Rich and batched file handlers.
+
+    Logging calls only enqueue the record; formatting and all terminal and
+    file output happen on a background listener thread. Without a terminal
+    (or with rich_output=False) console records go to stderr as plain text.
+    """
+    global _listener
+    shutdown_logging()
+
+    if rich_output is None:
+        rich_output = sys.stdout.isatty()
+    if rich_output:
+        console_handler = RichHandler(rich_tracebacks=True)
+        console_handler.setFormatter(logging.Formatter(
+            "%(message)s", datefmt="[%H:%M:%S]"))
+    else:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(logging.Formatter(
+            "[%(asctime)s] %(levelname)s %(message)s", datefmt="%H:%M:%S"))
+    file_handler = BatchedFileHandler(
+        log_file, mode=mode, batch_size=batch_size, flush_interval=flush_interval)
+    file_handler.setFormatter(logging.Formatter(
+        "[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
+
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=level, handlers=[
+                        _RecordQueueHandler(log_queue)], force=True)
+
+    _listener = _BatchingQueueListener(
+        log_queue, console_handler, file_handler, flush_interval=flush_interval)
+    _listener.start()
+
+
+def flush_logging(timeout=5.0):
+    """Wait until every record queued so far is handled and written out.
+
+    Unlike shutdown_logging() the listener keeps running, so logging stays
+    queued for anything that runs afterwards in the same process.
+    """
+    listener = _listener
+    if listener is None:
+        return
+    request = _FlushRequest()
+    listener.queue.put(request)
+    request.done.wait(timeout)
+
+
+def shutdown_logging():
+    """Drain the queue, flush everything and switch to direct handlers.
+
+    Safe to call more than once. Records logged afterwards are handled
+    synchronously by the same handlers, so nothing is lost.
+    """
+    global _listener
+    if _listener is None:
+        return
+    listener, _listener = _listener, None
+    listener.stop()
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, _RecordQueueHandler):
+            root.removeHandler(handler)
+    for handler in listener.handlers:
+        handler.flush()
+        root.addHandler(handler)
+
+
+atexit.register(shutdown_logging)
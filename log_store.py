@@ -0,0 +1,87 @@
+from array import array
+from bisect import bisect_right
+
+
+class LogStore:
+    """Compact append-only store for a large number of log lines.
+
+    Lines are kept UTF-8 encoded back to back in one bytearray, each ending
+    in a newline, with the start offset of every line in an array. Memory
+    per line is its text plus 9 bytes, and reading a window of lines decodes
+    only that window, however long the history is.
+
+    With max_lines set the oldest lines are dropped; the space they used is
+    reclaimed once they make up half of the store.
+    """
+
+    def __init__(self, max_lines=None):
+        self.max_lines = max_lines
+        self._data = bytearray()
+        self._offsets = array("Q")
+        self._first = 0  # Position in _offsets of the oldest kept line
+
+    def __len__(self):
+        return len(self._offsets) - self._first
+
+    def append(self, line):
+        """Add one line; it must not contain newlines"""
+        self._offsets.append(len(self._data))
+        self._data += line.encode("utf-8", "replace")
+        self._data += b"\n"
+        if self.max_lines is not None and len(self) > self.max_lines:
+            self._first += 1
+            if self._first > len(self._offsets) // 2:
+                self._compact()
+
+    def _compact(self):
+        cut = self._offsets[self._first]
+        del self._data[:cut]
+        self._offsets = array("Q", (offset - cut for offset in self._offsets[self._first:]))
+        self._first = 0
+
+    def _span(self, start, stop):
+        """Byte range of lines start..stop-1"""
+        begin = self._offsets[self._first + start]
+        end = (self._offsets[self._first + stop]
+               if self._first + stop < len(self._offsets) else len(self._data))
+        return begin, end
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("log line index out of range")
+        begin, end = self._span(index, index + 1)
+        return self._data[begin:end - 1].decode("utf-8")
+
+    def window(self, start, count):
+        """Return up to count lines from start, decoding only those lines"""
+        start = max(0, start)
+        stop = min(len(self), start + count)
+        if start >= stop:
+            return []
+        begin, end = self._span(start, stop)
+        return self._data[begin:end - 1].decode("utf-8").split("\n")
+
+    def _line_at(self, position):
+        return bisect_right(self._offsets, position, self._first) - 1 - self._first
+
+    def search(self, text, start=0, reverse=False):
+        """Index of the first line from start containing text, or None.
+
+        With reverse, search from line start towards older lines instead.
+        """
+        if not len(self):
+            return None
+        needle = text.encode("utf-8")
+        start = min(max(0, start), len(self) - 1)
+        if reverse:
+            begin, _ = self._span(0, 1)
+            _, end = self._span(start, start + 1)
+            position = self._data.rfind(needle, begin, end)
+        else:
+            begin, _ = self._span(start, start + 1)
+            position = self._data.find(needle, begin)
+        if position < 0:
+            return None
+        return self._line_at(position)
@@ -0,0 +1,289 @@
+"""Summary statistics computed per partition and merged afterwards.
+
+Each partition is reduced in a single task to a small dict of partial
+statistics: counts, means and co-moments of the numeric columns over the
+rows where each pair is present (Welford/Chan updates, so variance and
+pairwise-complete correlation merge exactly),
+min/max, category counts and a quantile sketch. Partials can be merged in
+any order, so partitions can be reduced in worker processes.
+
+Functions here run in worker processes, so this module must stay free of
+import-time side effects such as logging setup or a Live display.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from progress_channel import pool_context
+
+QUANTILES = (0.25, 0.5, 0.75)
+
+
+def _as_float(column):
+    """Column values as float64, with NaN for missing values (including NaT)"""
+    if pd.api.types.is_datetime64_dtype(column.dtype):
+        values = column.to_numpy(dtype="datetime64[ns]").astype(np.int64).astype(np.float64)
+        # NaT converts to the smallest int64, not NaN
+        values[column.isna().to_numpy()] = np.nan
+        return values
+    return column.to_numpy(dtype=np.float64)
+
+
+def _divide(numerator, denominator):
+    """Elementwise numerator / denominator, 0 where the denominator is 0"""
+    return np.divide(numerator, denominator, out=np.zeros_like(numerator, dtype=np.float64),
+                     where=denominator > 0)
+
+
+def partial_stats(df, columns, datetimes=(), category=None, sketch_size=4097):
+    """Reduce one partition to mergeable statistics.
+
+    columns are the numeric and datetime columns to describe. Missing values
+    are skipped per column, like describe() does. Counts, means and
+    co-moments are kept for every pair of columns over the rows where both
+    are present, so the correlation is pairwise-complete like
+    DataFrame.corr(); the diagonal holds each column's own count, mean and
+    sum of squared deviations. Quantiles come from a sketch of at most
+    sketch_size points per column: exact while a partition is no bigger
+    than that, approximate above it.
+    """
+    columns = list(columns)
+    stats = _array_stats(_column_values(df, columns), columns, datetimes, sketch_size)
+    if category is not None:
+        stats["category_counts"] = df[category].value_counts(sort=False).to_dict()
+    return stats
+
+
+def _column_values(df, columns):
+    # One row per column, so each column's values are contiguous
+    return (np.vstack([_as_float(df[name]) for name in columns])
+            if columns else np.empty((0, len(df))))
+
+
+def _array_stats(values, columns, datetimes, sketch_size=4097):
+    """partial_stats() of the columns x rows array of values, without category counts"""
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    counts = present.sum(axis=1)
+
+    # Center on each column's own mean before multiplying, to keep the
+    # products small; missing values become 0 and drop out of the sums
+    column_mean = _divide(np.where(present, values, 0.0).sum(axis=1), counts)
+    centered = np.where(present, values - column_mean[:, None], 0.0)
+    # pair_count[i, j]: rows where columns i and j are both present
+    pair_count = mask @ mask.T
+    # sums[i, j]: sum of centered column i over the rows where j is present
+    sums = centered @ mask.T
+    shift = _divide(sums, pair_count)
+    # pair_mean[i, j]: mean of column i over the rows where i and j are present
+    pair_mean = column_mean[:, None] + shift
+    comoment = centered @ centered.T - shift * sums.T
+    # pair_m2[i, j]: squared deviations of column i over the same rows
+    pair_m2 = (centered ** 2) @ mask.T - shift * sums
+
+    # Sorting gives min, max and the quantile sketch in one go (NaNs sort last)
+    ordered = np.sort(values, axis=1)
+    minimum = np.full(len(columns), np.nan)
+    maximum = np.full(len(columns), np.nan)
+    sketches = []
+    for index, count in enumerate(counts):
+        column = ordered[index, :count]
+        if count:
+            minimum[index], maximum[index] = column[0], column[-1]
+        if count > sketch_size:
+            positions = np.linspace(0, count - 1, sketch_size)
+            low = positions.astype(np.intp)
+            high = np.minimum(low + 1, count - 1)
+            column = column[low] + (column[high] - column[low]) * (positions - low)
+        # Sketch points with the number of rows each one stands for
+        sketches.append([(column, count / len(column) if len(column) else 0.0)])
+
+    return {
+        "columns": columns,
+        "datetimes": list(datetimes),
+        "pair_count": pair_count,
+        "pair_mean": pair_mean,
+        "pair_m2": pair_m2,
+        "comoment": comoment,
+        "min": minimum,
+        "max": maximum,
+        "sketch": sketches,
+        "sketch_size": sketch_size,
+        "category_counts": {},
+    }
+
+
+def merge_stats(a, b):
+    """Combine the partial statistics of two partitions"""
+    # Chan et al.'s pairwise update, applied to every pair of columns
+    count = a["pair_count"] + b["pair_count"]
+    delta = b["pair_mean"] - a["pair_mean"]
+    weight = _divide(a["pair_count"] * b["pair_count"], count)
+    merged = dict(a)
+    merged["pair_count"] = count
+    merged["pair_mean"] = a["pair_mean"] + delta * _divide(b["pair_count"], count)
+    merged["pair_m2"] = a["pair_m2"] + b["pair_m2"] + delta ** 2 * weight
+    merged["comoment"] = a["comoment"] + b["comoment"] + delta * delta.T * weight
+    merged["min"] = np.fmin(a["min"], b["min"])
+    merged["max"] = np.fmax(a["max"], b["max"])
+    # Merged sketches are compacted once they hold twice the sketch size, so
+    # merging any number of partials (chunks of a stream) keeps them bounded
+    merged["sketch"] = []
+    for index, sketch in enumerate(zip(a["sketch"], b["sketch"])):
+        sketch = sketch[0] + sketch[1]
+        if sum(len(values) for values, _ in sketch) > 2 * a["sketch_size"]:
+            sketch = _compact_sketch(sketch, count[index, index], a["sketch_size"])
+        merged["sketch"].append(sketch)
+    category_counts = dict(a["category_counts"])
+    for key, value in b["category_counts"].items():
+        category_counts[key] = category_counts.get(key, 0) + value
+    merged["category_counts"] = category_counts
+    return merged
+
+
+def _sketch_positions(sketch, count):
+    """Sorted points of a column's sketches and each one's position among its count rows"""
+    points = np.concatenate([values for values, _ in sketch])
+    weights = np.concatenate([np.full(len(values), weight) for values, weight in sketch])
+    order = np.argsort(points, kind="stable")
+    points, weights = points[order], weights[order]
+    positions = np.cumsum(weights) - weights
+    if positions[-1] > 0:
+        positions *= (count - 1) / positions[-1]
+    return positions, points
+
+
+def _compact_sketch(sketch, count, size):
+    """Resample a column's sketches into a single one of size evenly spaced points"""
+    positions, points = _sketch_positions(sketch, count)
+    return [(np.interp(np.linspace(0, count - 1, size), positions, points), count / size)]
+
+
+def _sketch_quantiles(sketch, count):
+    """Quantiles of a column from its merged sketches, interpolated like pandas"""
+    positions, points = _sketch_positions(sketch, count)
+    return np.interp([q * (count - 1) for q in QUANTILES], positions, points)
+
+
+def finalize(stats, correlation_columns=()):
+    """Turn merged statistics into mean, std, category counts, correlation and describe()"""
+    columns, datetimes = stats["columns"], stats["datetimes"]
+    counts = np.diag(stats["pair_count"])
+    means = np.diag(stats["pair_mean"])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(np.where(counts > 1, np.diag(stats["pair_m2"]) / (counts - 1), np.nan))
+
+    summary = {}
+    for index, name in enumerate(columns):
+        count = int(counts[index])
+        quantiles = (_sketch_quantiles(stats["sketch"][index], count)
+                     if count else [np.nan] * len(QUANTILES))
+        row = {"count": float(count), "mean": means[index] if count else np.nan,
+               "std": std[index], "min": stats["min"][index],
+               **{f"{q:.0%}": value for q, value in zip(QUANTILES, quantiles)},
+               "max": stats["max"][index]}
+        if name in datetimes:
+            row = {key: value if key == "count" else
+                   (pd.Timestamp(int(value)) if not np.isnan(value) else pd.NaT)
+                   for key, value in row.items() if key != "std"}
+        summary[name] = row
+    # Same row order as DataFrame.describe()
+    index = (["count", "mean", "min", "25%", "50%", "75%", "max", "std"] if datetimes
+             else ["count", "mean", "std", "min", "25%", "50%", "75%", "max"])
+    summary_stats = pd.DataFrame(summary, index=index)
+
+    positions = np.ix_(*[[columns.index(name) for name in correlation_columns]] * 2)
+    m2 = stats["pair_m2"][positions]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        correlation = stats["comoment"][positions] / np.sqrt(m2 * m2.T)
+    correlation[stats["pair_count"][positions] < 2] = np.nan
+    correlation = pd.DataFrame(correlation, index=list(correlation_columns),
+                               columns=list(correlation_columns))
+
+    category_counts = dict(sorted(stats["category_counts"].items(),
+                                  key=lambda item: item[1], reverse=True))
+    return {"summary_stats": summary_stats, "correlation_matrix": correlation,
+            "category_counts": category_counts,
+            "count": dict(zip(columns, counts.astype(int).tolist())),
+            "mean": dict(zip(columns, np.where(counts > 0, means, np.nan))),
+            "std": dict(zip(columns, std))}
+
+
+def describe_columns(df):
+    """Return the columns describe() covers (numeric and datetime) and which are datetimes"""
+    columns = [name for name, dtype in df.dtypes.items()
+               if (pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype))
+               or pd.api.types.is_datetime64_dtype(dtype)]
+    datetimes = [name for name in columns if pd.api.types.is_datetime64_dtype(df[name].dtype)]
+    return columns, datetimes
+
+
+def _shared_partition_stats(name, rows, start, stop, columns, datetimes, categories):
+    """partial_stats() of rows start:stop, read from the shared block analyze_partitions made"""
+    memory = shared_memory.SharedMemory(name)
+    try:
+        values = np.ndarray((len(columns), rows), np.float64, memory.buf)
+        stats = _array_stats(values[:, start:stop], columns, datetimes)
+        if categories is not None:
+            codes = np.ndarray(rows, np.int64, memory.buf, offset=values.nbytes)[start:stop]
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+            stats["category_counts"] = dict(zip(categories, counts.tolist()))
+            del codes
+        # The views must go before the block can be closed
+        del values
+    finally:
+        memory.close()
+    return stats
+
+
+def analyze_partitions(df, category=None, correlation_columns=(), workers=4,
+                       min_partition_rows=100_000):
+    """Compute describe()-style statistics of df, reducing partitions in a process pool.
+
+    Frames too small to fill two partitions are reduced in this process.
+    Otherwise the column values and category codes are copied once into a
+    shared memory block; workers are sent only its name and their row range,
+    and send back the small partial results.
+    """
+    columns, datetimes = describe_columns(df)
+
+    partitions = max(1, min(workers, len(df) // min_partition_rows))
+    size = max(1, -(-len(df) // partitions))  # Ceiling division; 1 for an empty frame
+    bounds = [(start, min(start + size, len(df))) for start in range(0, len(df), size)]
+
+    if len(bounds) <= 1:
+        partials = [partial_stats(df, columns, datetimes, category)]
+    else:
+        rows = len(df)
+        memory = shared_memory.SharedMemory(create=True, size=(len(columns) + 1) * rows * 8)
+        try:
+            values = np.ndarray((len(columns), rows), np.float64, memory.buf)
+            for index, name in enumerate(columns):
+                values[index] = _as_float(df[name])
+            categories = None
+            if category is not None:
+                codes = np.ndarray(rows, np.int64, memory.buf, offset=values.nbytes)
+                column = df[category]
+                if isinstance(column.dtype, pd.CategoricalDtype):
+                    codes[:], categories = column.cat.codes, column.cat.categories
+                else:
+                    codes[:], categories = pd.factorize(column)
+                categories = categories.tolist()
+                del codes
+            del values
+
+            with ProcessPoolExecutor(max_workers=len(bounds), mp_context=pool_context()) as pool:
+                futures = [pool.submit(_shared_partition_stats, memory.name, rows, start, stop,
+                                       columns, datetimes, categories)
+                           for start, stop in bounds]
+                partials = [future.result() for future in futures]
+        finally:
+            memory.close()
+            memory.unlink()
+
+    merged = partials[0]
+    for partial in partials[1:]:
+        merged = merge_stats(merged, partial)
+    return finalize(merged, correlation_columns)
@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from headless_backend import json_default
+
+FORMATS = ("parquet", "npz", "csv")
+EXTENSIONS = {"parquet": ".parquet", "npz": ".npz", "csv": ".csv"}
+
+
+def default_format():
+    """Parquet if pyarrow is installed, otherwise numpy's npz archive"""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "npz"
+    return "parquet"
+
+
+def write_npz(df, f):
+    """Write a frame column by column into an uncompressed npz archive.
+
+    Categoricals are stored as codes plus categories, strings as
+    fixed-width unicode arrays plus a mask of missing values, and
+    timezone-aware datetimes as UTC datetime64 plus the timezone name, so
+    nothing needs pickling; read_npz() restores the frame.
+    """
+    arrays = {}
+    for position, (name, column) in enumerate(df.items()):
+        key = f"{position}:{name}"
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            arrays[f"{key}:codes"] = column.cat.codes.to_numpy()
+            arrays[f"{key}:categories"] = column.cat.categories.to_numpy().astype(str)
+        elif isinstance(column.dtype, pd.DatetimeTZDtype):
+            arrays[f"{key}:utc"] = column.dt.tz_convert(None).to_numpy()
+            arrays[f"{key}:tz"] = np.array(str(column.dt.tz))
+        elif (pd.api.types.is_object_dtype(column.dtype)
+              or isinstance(column.dtype, pd.StringDtype)):
+            missing = column.isna().to_numpy()
+            arrays[f"{key}:str"] = column.fillna("").to_numpy().astype(str)
+            arrays[f"{key}:null"] = missing
+        else:
+            arrays[key] = column.to_numpy()
+    np.savez(f, **arrays)
+
+
+def read_npz(path):
+    """Read a frame written by write_npz()"""
+    columns = {}
+    with np.load(path) as archive:
+        for key in archive.files:
+            position, name, *kind = key.split(":")
+            if kind == ["codes"]:
+                columns[int(position), name] = pd.Categorical.from_codes(
+                    archive[key], archive[f"{position}:{name}:categories"])
+            elif kind == ["str"]:
+                values = archive[key].astype(object)
+                values[archive[f"{position}:{name}:null"]] = None
+                columns[int(position), name] = values
+            elif kind == ["utc"]:
+                columns[int(position), name] = pd.DatetimeIndex(archive[key]).tz_localize(
+                    "UTC").tz_convert(str(archive[f"{position}:{name}:tz"]))
+            elif not kind:
+                columns[int(position), name] = archive[key]
+    return pd.DataFrame({name: values for (_, name), values in sorted(columns.items())})
+
+
+def _jsonable(value):
+    """Turn DataFrames and Series in analysis results into plain dicts, NaN and NaT into None"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        value = value.to_dict()
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if pd.api.types.is_scalar(value) and pd.isna(value):
+        return None
+    return value
+
+
+class OutputWriter:
+    """Writes output files on a background thread.
+
+    Each file is written to a temporary name next to it and renamed into
+    place once complete, so readers never see a partial file. Bytes written
+    and write time are counted for the status panel, and so are failed
+    writes; the exception itself is raised from the returned Future.
+    """
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="output-writer")
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.failures = 0
+        self.files = 0
+        self.bytes_written = 0
+        self.write_time = 0.0
+
+    @property
+    def throughput(self):
+        """Bytes per second while writing, or None before the first file"""
+        return self.bytes_written / self.write_time if self.write_time else None
+
+    def submit(self, path, write):
+        """Run write(file) in the background; returns a Future of the file size"""
+        with self._lock:
+            self.pending += 1
+        return self._executor.submit(self._write, path, write)
+
+    def _write(self, path, write):
+        start = time.perf_counter()
+        temporary = f"{path}.tmp"
+        try:
+            with open(temporary, "wb") as f:
+                write(f)
+            os.replace(temporary, path)
+            size = os.path.getsize(path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            with self._lock:
+                self.failures += 1
+            raise
+        finally:
+            with self._lock:
+                self.pending -= 1
+        with self._lock:
+            self.files += 1
+            self.bytes_written += size
+            self.write_time += time.perf_counter() - start
+        return size
+
+    def write_frame(self, df, path, format="npz"):
+        if format == "parquet":
+            return self.submit(path, lambda f: df.to_parquet(f, index=False))
+        if format == "csv":
+            return self.submit(path, lambda f: df.to_csv(f, index=False))
+        return self.submit(path, lambda f: write_npz(df, f))
+
+    def write_json(self, data, path):
+        def write(f):
+            # Bare NaN is not JSON; missing values are written as null
+            f.write(json.dumps(_jsonable(data), default=json_default, indent=2,
+                               allow_nan=False).encode())
+        return self.submit(path, write)
+
+    def close(self):
+        """Wait for pending writes to finish"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,17 @@
+import pandas as pd
+
+from derived_columns import add_derived_columns
+from progress_channel import report
+
+# Functions here run in worker processes, so this module must stay free of
+# import-time side effects such as logging setup or a Live display.
+
+
+def process_partition(df, report_every=10_000):
+    """Clean a partition of the frame, reporting progress as rows are done"""
+    parts = []
+    for start in range(0, len(df), report_every):
+        piece = df.iloc[start:start + report_every]
+        parts.append(add_derived_columns(piece.dropna()))
+        report(rows=len(piece))
+    return pd.concat(parts) if parts else add_derived_columns(df)
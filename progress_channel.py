@@ -0,0 +1,84 @@
+import multiprocessing
+
+_writer = None  # Set in each worker process by ProgressChannel.initializer
+
+
+def pool_context():
+    """Start method for worker pools: forkserver where available, else spawn.
+
+    Not fork: the parent runs the Live refresh thread, the logging listener
+    and the output writer while pools are in use, and a forked child can
+    inherit one of their locks held and deadlock on it. Workers start from
+    a fresh interpreter instead, so their arguments must be picklable.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class ProgressChannel:
+    """Shared-memory progress counters written by worker processes.
+
+    Every worker gets its own row of 64-bit counters in a shared array and
+    only ever writes to that row, so reporting needs no lock or message
+    passing. The parent reads all rows whenever it renders.
+
+    Pass `context`, `initializer` and `initargs` to the ProcessPoolExecutor;
+    workers then call `report(rows=n)` from this module.
+    """
+
+    def __init__(self, workers, counters=("rows",), expected_total=None, context=None):
+        self.workers = workers
+        self.counters = list(counters)
+        self.expected_total = expected_total  # Of the first counter, if known
+        # The shared objects must come from the same context as the pool
+        self.context = context or pool_context()
+        self._values = self.context.RawArray(
+            'q', workers * len(self.counters))
+        self._next_slot = self.context.Value('i', 0)
+
+    @property
+    def initializer(self):
+        return _attach_worker
+
+    @property
+    def initargs(self):
+        return (self._values, self._next_slot, self.counters)
+
+    def per_worker(self):
+        """Return one {counter: value} dict per worker slot"""
+        values = self._values[:]  # One copy of the whole array
+        width = len(self.counters)
+        return [dict(zip(self.counters, values[slot * width:(slot + 1) * width]))
+                for slot in range(self.workers)]
+
+    def totals(self):
+        """Return {counter: value} summed over all workers"""
+        totals = dict.fromkeys(self.counters, 0)
+        for counts in self.per_worker():
+            for key, value in counts.items():
+                totals[key] += value
+        return totals
+
+
+class _Writer:
+    def __init__(self, values, offset, counters):
+        self.values = values
+        self.index = {key: offset + i for i, key in enumerate(counters)}
+
+
+def _attach_worker(values, next_slot, counters):
+    """Claim the next free slot of the channel for this worker process"""
+    global _writer
+    with next_slot.get_lock():
+        slot = next_slot.value
+        next_slot.value += 1
+    _writer = _Writer(values, slot * len(counters), counters)
+
+
+def report(**counts):
+    """Add to this worker's counters; does nothing outside a channel worker"""
+    if _writer is None:
+        return
+    for key, amount in counts.items():
+        _writer.values[_writer.index[key]] += amount
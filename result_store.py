@@ -0,0 +1,125 @@
+from collections import OrderedDict
+import os
+import pickle
+import sys
+import tempfile
+import threading
+
+import pandas as pd
+
+
+def estimate_size(value):
+    """Rough in-memory size of a step result in bytes"""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value.values())
+    return sys.getsizeof(value)
+
+
+class ResultStore:
+    """Step results kept under a memory budget, spilling cold ones to disk.
+
+    Results are held in least-recently-used order. When the results in
+    memory exceed `memory_budget_mb`, the least recently used ones are
+    pickled to a temporary directory and dropped from memory; `get` loads
+    them back transparently. With no budget nothing is ever spilled.
+
+    Spilling only lowers peak memory if the caller doesn't hold on to the
+    result itself. Methods are safe to call from several threads.
+    """
+
+    def __init__(self, memory_budget_mb=None, spill_dir=None):
+        self.memory_budget = memory_budget_mb * 1024**2 if memory_budget_mb else None
+        self._spill_dir = spill_dir
+        self._temp_dir = None  # Created on first spill when no spill_dir is given
+        self._memory = OrderedDict()  # name -> (value, size), oldest first
+        self._spilled = {}  # name -> (path, size)
+        self.memory_bytes = 0
+        self.spills = 0
+        self.spilled_bytes = 0
+        self.reloads = 0
+        self.reloaded_bytes = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, name):
+        return name in self._memory or name in self._spilled
+
+    def __setitem__(self, name, value):
+        size = estimate_size(value)
+        with self._lock:
+            self.pop(name)
+            self._memory[name] = (value, size)
+            self.memory_bytes += size
+            self._enforce_budget(keep=name)
+
+    def get(self, name, default=None):
+        with self._lock:
+            return self._get(name, default)
+
+    def _get(self, name, default):
+        if name in self._memory:
+            self._memory.move_to_end(name)
+            return self._memory[name][0]
+        if name not in self._spilled:
+            return default
+
+        path, size = self._spilled.pop(name)
+        with open(path, "rb") as f:
+            value = pickle.load(f)
+        os.remove(path)
+        self.reloads += 1
+        self.reloaded_bytes += size
+        self._memory[name] = (value, size)
+        self.memory_bytes += size
+        self._enforce_budget(keep=name)
+        return value
+
+    def pop(self, name):
+        """Forget a result, wherever it is stored"""
+        with self._lock:
+            if name in self._memory:
+                value, size = self._memory.pop(name)
+                self.memory_bytes -= size
+                return value
+            if name in self._spilled:
+                path, size = self._spilled.pop(name)
+                os.remove(path)
+            return None
+
+    def _enforce_budget(self, keep):
+        if self.memory_budget is None:
+            return
+        for name in list(self._memory):
+            if self.memory_bytes <= self.memory_budget:
+                break
+            if name != keep:
+                self._spill(name)
+
+    def _spill(self, name):
+        if self._spill_dir is None:
+            # Removed by close() or, at the latest, when the interpreter exits
+            self._temp_dir = tempfile.TemporaryDirectory(prefix="step_results_")
+            self._spill_dir = self._temp_dir.name
+        value, size = self._memory.pop(name)
+        path = os.path.join(self._spill_dir, f"result_{self.spills}.pkl")
+        with open(path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled[name] = (path, size)
+        self.memory_bytes -= size
+        self.spills += 1
+        self.spilled_bytes += size
+
+    def close(self):
+        """Delete all spilled files"""
+        with self._lock:
+            for path, _ in self._spilled.values():
+                if os.path.exists(path):
+                    os.remove(path)
+            self._spilled.clear()
+            if self._temp_dir is not None:
+                self._temp_dir.cleanup()
+                self._temp_dir = None
+                self._spill_dir = None
@@ -2,22 +2,12 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.console import Console
 from rich import print
-from rich.logging import RichHandler
 import logging
 import time
+from log_setup import setup_logging
 
-file_handler = logging.FileHandler("rich_log.log", mode="w")
-file_handler.setFormatter(logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
-
-logging.basicConfig(
-    level=logging.NOTSET,
-    format="%(message)s",
-    datefmt="[%H:%M:%S]",
-    handlers=[
-        RichHandler(rich_tracebacks=True),
-        file_handler
-    ]
-)
+# Setup logging: Rich and file output run on a background thread behind a queue
+setup_logging()
 
 console = Console()
 
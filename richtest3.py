@@ -2,9 +2,8 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.console import Console
 from rich import print
-from rich.logging import RichHandler
-import logging
 import time
+from log_setup import setup_logging
 
 
 def add_step_info_line(current_step):
@@ -33,19 +32,8 @@ Time: {time.strftime('%H:%M:%S')}
 
 if __name__ == "__main__":
 
-    file_handler = logging.FileHandler("rich_log.log", mode="w")
-    file_handler.setFormatter(logging.Formatter(
-        "[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
-
-    logging.basicConfig(
-        level=logging.NOTSET,
-        format="%(message)s",
-        datefmt="[%H:%M:%S]",
-        handlers=[
-            RichHandler(rich_tracebacks=True),
-            file_handler
-        ]
-    )
+    # Rich and file output run on a background thread behind a queue
+    setup_logging()
 
     console = Console()
 
@@ -2,143 +2,231 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.console import Console
 from rich import print
-from rich.logging import RichHandler
 import logging
+import threading
 import time
+from log_setup import flush_logging, setup_logging
+from concurrent_state import StepCounter
+from step_formatters import markup_formatter
+from step_history import StepHistory
+from step_metrics import StepMetrics, StepTimer
+from step_rates import StepProgress, format_duration, run_remaining
 
-# Setup logging (same as your original)
-file_handler = logging.FileHandler("rich_log.log", mode="w")
-file_handler.setFormatter(logging.Formatter(
-    "[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
-logging.basicConfig(
-    level=logging.NOTSET,
-    format="%(message)s",
-    datefmt="[%H:%M:%S]",
-    handlers=[
-        RichHandler(rich_tracebacks=True),
-        file_handler
-    ]
-)
+# Setup logging: Rich and file output run on a background thread behind a queue
+setup_logging()
 
 console = Console()
 log = logging.getLogger("rich")
 
 
 class StatusTracker:
-    def __init__(self):
+    def __init__(self, history_file=None):
         self.current_step = ""
         self.step_number = 0
         self.total_steps = 0
         self.errors = 0
-        self.completed_steps = []
+        # Bounded display history; pass history_file to keep every completed step on disk
+        self.completed_steps = StepHistory(history_file=history_file)
         self.step_data = {}  # Store data for current and completed steps
+        self._counters = []  # (key, StepCounter) of the current step, read on the render tick
+        # Key -> formatter table for step data; add entries with formatter.register()
+        self.formatter = markup_formatter()
+        # Measured wall/CPU/GC figures of recently finished steps, and the hot step
+        self.step_metrics = StepMetrics()
+        self._step_timers = {}
+        # Expected counter totals; rates and ETAs are estimated when the panel is built
+        self.progress = StepProgress()
         self.live = None
+        # Guards the step state against the Live refresh thread building the panel
+        self._lock = threading.RLock()
+        self._dirty = True  # Set by every state change, cleared when the panel is rebuilt
+        self._panel = None
+        self._panel_time = None
 
     def __enter__(self):
-        self.live = Live(self._create_status_panel(), refresh_per_second=4)
+        # Live pulls the panel on each refresh tick instead of having it pushed on every update
+        self.live = Live(get_renderable=self._get_status_panel,
+                         refresh_per_second=4)
         self.live.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Drain queued log records while the panel is still live
+        flush_logging()
         if self.live:
             self.live.__exit__(exc_type, exc_val, exc_tb)
+        self.completed_steps.close()
 
     def set_total_steps(self, total):
-        self.total_steps = total
+        with self._lock:
+            self.total_steps = total
         self._update_display()
 
     def start_step(self, step_name):
-        self.step_number += 1
-        self.current_step = step_name
-        self.step_data[step_name] = {}  # Initialize data storage for this step
+        with self._lock:
+            self.step_number += 1
+            # The previous step's data already lives on in its completion line
+            self.step_data.pop(self.current_step, None)
+            self.current_step = step_name
+            self.step_data[step_name] = {}  # Initialize data storage for this step
+            self._step_timers[step_name] = StepTimer()
         print(
             f"\n[bold blue]Starting Step {self.step_number}: {step_name}[/bold blue]")
         self._update_display()
 
+    def set_step_total(self, counter, total):
+        """Declare the expected final value of a current step counter, for rate and ETA"""
+        with self._lock:
+            self.progress.expect(self.current_step, counter, total)
+        self._update_display()
+
     def update_step_data(self, **data):
         """Update data for the current step"""
         if self.current_step:
-            self.step_data[self.current_step].update(data)
+            with self._lock:
+                self.step_data[self.current_step].update(data)
             self._update_display()
 
+    def counter(self, key):
+        """Return a StepCounter adding to a data key of the current step.
+
+        c.add(n) costs a single integer add; the panel picks the value up on
+        its next refresh.
+        """
+        counter = StepCounter()
+        with self._lock:
+            self._counters.append((key, counter))
+        self._update_display()
+        return counter
+
+    def _current_step_data(self):
+        data = self.step_data.get(self.current_step)
+        if data is None or not self._counters:
+            return data
+        data = dict(data)
+        for key, counter in self._counters:
+            data[key] = data.get(key, 0) + counter.value
+        return data
+
     def complete_step(self, step_name=None, **final_data):
         """Complete step with optional final data"""
         step_name = step_name or self.current_step
         timestamp = time.strftime('%H:%M:%S')
-
-        # Add any final data
-        if final_data and step_name in self.step_data:
-            self.step_data[step_name].update(final_data)
-
-        # Create completion message with data if available
-        completion_msg = f"✓ {timestamp} - {step_name} completed!"
-        if step_name in self.step_data and self.step_data[step_name]:
-            data_summary = self._format_step_data(self.step_data[step_name])
-            if data_summary:
-                completion_msg += f" ({data_summary})"
-
-        self.completed_steps.append(completion_msg)
+        with self._lock:
+            metrics = self._stop_timer(step_name)
+            self.progress.forget(step_name)
+            if step_name == self.current_step:
+                # Fold the counters into the step's data
+                if step_name in self.step_data:
+                    self.step_data[step_name] = self._current_step_data()
+                self._counters = []
+
+            # Add measured metrics and any final data
+            if step_name in self.step_data:
+                self.step_data[step_name].update(metrics)
+                self.step_data[step_name].update(final_data)
+
+            # Create completion message with data if available
+            completion_msg = f"✓ {timestamp} - {step_name} completed!"
+            if step_name in self.step_data and self.step_data[step_name]:
+                data_summary = self._format_step_data(self.step_data[step_name])
+                if data_summary:
+                    completion_msg += f" ({data_summary})"
+
+            self.completed_steps.add(completion_msg, metrics.get("wall_time"))
         print(f"[bold green]{completion_msg}[/bold green]")
         self._update_display()
 
+    def _stop_timer(self, step_name):
+        """Stop the step's timer and record its metrics; {} if it wasn't running"""
+        timer = self._step_timers.pop(step_name, None)
+        if timer is None:
+            return {}
+        metrics = timer.stop()
+        self.step_metrics.add(step_name, metrics)
+        return metrics
+
+    def hot_step(self, metric="wall_time"):
+        """Return (step name, value) of the finished step with the highest metric"""
+        return self.step_metrics.hot(metric)
+
     def _format_step_data(self, data):
         """Format step data for display"""
         if not data:
             return ""
-
-        formatted_parts = []
-        for key, value in data.items():
-            if key == "lines_processed":
-                formatted_parts.append(f"[green]{value:,}[/green] lines")
-            elif key == "records_found":
-                formatted_parts.append(f"[green]{value:,}[/green] records")
-            elif key == "output_file":
-                formatted_parts.append(f"saved to [green]{value}[/green]")
-            elif key == "files_created":
-                formatted_parts.append(f"[green]{value}[/green] files created")
-            elif key == "notifications_sent":
-                formatted_parts.append(
-                    f"[green]{value}[/green] notifications sent")
-            elif key == "errors_found":
-                formatted_parts.append(f"[red]{value}[/red] errors found")
-            elif key == "processing_time":
-                formatted_parts.append(f"[green]{value:.2f}[/green]s")
-            else:
-                # Generic formatting for other data types
-                formatted_parts.append(f"{key}: [green]{value}[/green]")
-
-        return ", ".join(formatted_parts)
+        return self.formatter.format(data)
 
     def add_error(self):
-        self.errors += 1
+        with self._lock:
+            self.errors += 1
+            self._stop_timer(self.current_step)
+            self.progress.forget(self.current_step)
+            self._counters = []
+            self.completed_steps.add_failure()
         self._update_display()
 
     def _create_status_panel(self):
         status_text = f"""Current Step: {self.current_step}
 Progress: {len(self.completed_steps)}/{self.total_steps} steps completed
 Errors: {self.errors}
+Step Time: {self.completed_steps.total_time:.2f}s
 Time: {time.strftime('%H:%M:%S')}"""
 
+        hot_step, hot_time = self.hot_step()
+        if hot_step:
+            status_text += f"\nHot Step: {hot_step} ({hot_time:.2f}s)"
+
         # Add current step data if available
         if self.current_step and self.current_step in self.step_data:
-            current_data = self._format_step_data(
-                self.step_data[self.current_step])
+            data = self._current_step_data()
+            current_data = self._format_step_data(data)
             if current_data:
                 status_text += f"\nCurrent Data: {current_data}"
 
+            # Rates are sampled here, once per rebuilt panel, not on every update
+            estimates = self.progress.estimate(self.current_step, data)
+            if estimates:
+                status_text += f"\nStep Progress: {self.progress.format(estimates)}"
+            remaining = self._run_remaining(estimates)
+            if remaining is not None:
+                status_text += f"\nRun ETA: {format_duration(remaining)} left"
+
         if self.completed_steps:
-            status_text += "\n\nCompleted Steps:"
-            # Show last 5 completed steps to avoid panel getting too large
-            for step in self.completed_steps[-5:]:
-                status_text += f"\n{step}"
-            if len(self.completed_steps) > 5:
-                status_text += f"\n... and {len(self.completed_steps) - 5} more"
+            # Only the last 5 completed steps are kept, rendered once per new step
+            status_text += "\n\n" + self.completed_steps.render()
 
         return Panel(status_text, title="Processing Status", border_style="blue")
 
+    def _run_remaining(self, estimates):
+        """Seconds left in the run, from the step's counters or the average step"""
+        timer = self._step_timers.get(self.current_step)
+        if timer is None:
+            return None  # Between steps
+        step_remaining = self.progress.remaining(estimates)
+        if step_remaining is None and self.completed_steps:
+            average = self.completed_steps.total_time / len(self.completed_steps)
+            step_remaining = max(average - timer.elapsed(), 0.0)
+        return run_remaining(step_remaining, self.total_steps,
+                             len(self.completed_steps), 1,
+                             self.completed_steps.total_time)
+
+    def _get_status_panel(self):
+        """Return the status panel, rebuilding it only if state changed since the last tick"""
+        now = time.strftime('%H:%M:%S')
+        # Counter handles don't set the dirty flag, so poll while there are any
+        if (self._dirty or self._panel is None or now != self._panel_time
+                or self._counters):
+            # Clear the flag before building so updates made meanwhile are not lost
+            self._dirty = False
+            self._panel_time = now
+            # Build from a consistent view of the steps; counters are not locked
+            with self._lock:
+                self._panel = self._create_status_panel()
+        return self._panel
+
     def _update_display(self):
-        if self.live:
-            self.live.update(self._create_status_panel())
+        # Only mark state as changed; the panel is built once per refresh tick
+        self._dirty = True
 
 # Example step functions with data tracking
 
@@ -173,14 +261,14 @@ def do_that(status):
     log.info(f"Retrieved {records_found:,} records")
 
     print("  - Processing data...")
-    lines_processed = 0
+    status.set_step_total("lines_processed", 1950)
+    lines_processed = status.counter("lines_processed")
     for i in range(10):  # Simulate processing
-        lines_processed += 150 + (i * 10)
-        status.update_step_data(lines_processed=lines_processed)
+        lines_processed.add(150 + (i * 10))
         time.sleep(0.07)
 
-    log.info(f"Data processing complete - {lines_processed:,} lines processed")
-    return {"records": records_found, "lines": lines_processed}
+    log.info(f"Data processing complete - {lines_processed.value:,} lines processed")
+    return {"records": records_found, "lines": lines_processed.value}
 
 
 def do_something_else(status):
@@ -264,7 +352,7 @@ def main():
         status.start_step("Initialize System")
         try:
             result = do_this(status)
-            status.complete_step(processing_time=1.8)
+            status.complete_step()
         except Exception as e:
             log.error(f"Error in step 1: {e}")
             status.add_error()
@@ -274,7 +362,7 @@ def main():
         try:
             result = do_that(status)
             # You can pass final data to complete_step
-            status.complete_step(processing_time=2.1)
+            status.complete_step()
         except Exception as e:
             log.error(f"Error in step 2: {e}")
             status.add_error()
@@ -283,7 +371,7 @@ def main():
         status.start_step("Generate Output")
         try:
             result = do_something_else(status)
-            status.complete_step(processing_time=1.8)
+            status.complete_step()
         except Exception as e:
             log.error(f"Error in step 3: {e}")
             status.add_error()
@@ -292,7 +380,7 @@ def main():
         status.start_step("Finalize")
         try:
             result = do_final_step(status)
-            status.complete_step(processing_time=1.2)
+            status.complete_step()
         except Exception as e:
             log.error(f"Error in step 4: {e}")
             status.add_error()
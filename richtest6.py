@@ -4,175 +4,617 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.console import Console
 from rich import print
-from rich.logging import RichHandler
+import asyncio
+import contextlib
+import contextvars
+import inspect
 import logging
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import time
-
-# Setup logging (same as your original)
-file_handler = logging.FileHandler("rich_log.log", mode="w")
-file_handler.setFormatter(logging.Formatter(
-    "[%(asctime)s] %(message)s", datefmt="%H:%M:%S"))
-logging.basicConfig(
-    level=logging.NOTSET,
-    format="%(message)s",
-    datefmt="[%H:%M:%S]",
-    handlers=[
-        RichHandler(rich_tracebacks=True),
-        file_handler
-    ]
-)
+from concurrent_state import ShardedStepData, StepCounter
+from derived_columns import add_derived_columns
+from dtype_compaction import compact_dtypes, memory_usage
+from mergeable_stats import (analyze_partitions, describe_columns, finalize,
+                             merge_stats, partial_stats)
+from output_writer import EXTENSIONS, OutputWriter, default_format
+from pipeline_workers import process_partition
+from progress_channel import ProgressChannel
+from result_store import ResultStore
+from step_cache import StepCache
+from step_graph import GraphStep, run_graph
+from headless_backend import HeadlessBackend
+from log_setup import flush_logging, setup_logging
+from step_formatters import plain_formatter
+from status_socket import StatusPublisher
+from step_journal import StepJournal
+from step_history import StepHistory
+from step_metrics import StepMetrics, StepTimer
+from step_rates import StepProgress, format_duration, run_remaining
+
+# Setup logging: Rich and file output run on a background thread behind a queue
+setup_logging()
 
 console = Console()
 log = logging.getLogger("rich")
 
+# Metrics left out of completion lines to keep them short; the Hot Step line shows them
+_DETAIL_METRICS = ("cpu_time", "gc_collections", "gc_pause")
+
+# Step run by the current asyncio task (or thread), so concurrent coroutine
+# steps can update their own data without passing step_name around
+_task_step = contextvars.ContextVar("task_step", default=None)
+
 
 class StatusTracker:
-    def __init__(self):
+    def __init__(self, history_file=None, concurrent=False, result_memory_mb=None,
+                 cache_dir=None, mode=None, snapshot_interval=5.0, journal_file=None,
+                 socket_path=None):
         self.current_step = ""
         self.step_number = 0
         self.total_steps = 0
         self.errors = 0
-        self.completed_steps = []
+        # Bounded display history; pass history_file to keep every completed step on disk
+        self.completed_steps = StepHistory(history_file=history_file)
         self.step_data = {}  # Store display data for current and completed steps
-        self.step_results = {}  # Store actual returned data from steps
+        # Store actual returned data from steps, spilling to disk beyond result_memory_mb
+        self.step_results = ResultStore(result_memory_mb)
+        self.active_steps = {}  # Steps started but not yet completed, in start order
+        self.progress_channels = []  # Progress reported by worker processes
+        # Opt-in cross-run cache of step results
+        self.step_cache = StepCache(cache_dir) if cache_dir else None
+        # Writes output files on a background thread, see save_results()
+        self.writer = OutputWriter()
+        # Key -> formatter table for step data; add entries with formatter.register()
+        self.formatter = plain_formatter()
+        # Measured wall/CPU/GC figures of recently finished steps, and the hot step
+        self.step_metrics = StepMetrics()
+        self._step_timers = {}
+        # Expected counter totals; rates and ETAs are estimated when the panel is built
+        self.progress = StepProgress()
         self.live = None
+        self._refresh_task = None  # Redraws the panel under `async with`
+        self._dirty = True  # Set by every state change, cleared when the panel is rebuilt
+        self._panel = None
+        self._panel_time = None
+        # Guards step structure (start/complete/errors) and the panel snapshot
+        self._lock = threading.RLock()
+        # In concurrent mode step data is written to per-thread shards without locking
+        self._shards = ShardedStepData() if concurrent else None
+        self._counters = {}  # step name -> [(key, StepCounter)], read on the render tick
+        self._counter_values = {}  # step name -> {key: value} last sent to the event sinks
+        # "rich" for the live panel, "headless" for JSON lines (cron, containers),
+        # "quiet" for no output of its own; picked from whether stdout is a
+        # terminal unless given, or quiet when a viewer process renders instead
+        if mode is None:
+            mode = "quiet" if socket_path else (
+                "rich" if sys.stdout.isatty() else "headless")
+        self.mode = mode
+        self.headless = None
+        self._event_sinks = []  # Objects with event(record), told about every step event
+        if self.mode == "headless":
+            self.headless = HeadlessBackend(self, interval=snapshot_interval)
+            self._event_sinks.append(self.headless)
+        # Opt-in structured record of every step event, see step_journal.py
+        self.journal = StepJournal(journal_file) if journal_file else None
+        if self.journal:
+            self._event_sinks.append(self.journal)
+        # Opt-in state stream for `python status_socket.py <socket_path>` viewers
+        self.publisher = StatusPublisher(self, socket_path) if socket_path else None
+        if self.publisher:
+            self._event_sinks.append(self.publisher)
 
     def __enter__(self):
-        self.live = Live(self._create_status_panel(), refresh_per_second=4)
+        if self.headless:
+            self.headless.start()
+        if self.mode != "rich":
+            return self
+        # Live pulls the panel on each refresh tick instead of having it pushed on every update
+        self.live = Live(get_renderable=self._get_status_panel,
+                         refresh_per_second=4)
         self.live.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Finish background writes and drain queued log records while the panel is still live
+        self.writer.close()
+        # Failed writes were logged as they happened; count them as errors of the run
+        for _ in range(self.writer.failures):
+            self.add_error()
+        flush_logging()
         if self.live:
             self.live.__exit__(exc_type, exc_val, exc_tb)
+        if self.headless:
+            self.headless.stop()
+        if self.journal:
+            self.journal.close()
+        if self.publisher:
+            self.publisher.close()
+        self.completed_steps.close()
+        # Delete spilled results; results still in memory stay readable
+        self.step_results.close()
+
+    async def __aenter__(self):
+        if self.headless:
+            self.headless.start(thread=False)
+        elif self.mode == "rich":
+            # No refresh thread: a task on the event loop redraws the panel
+            self.live = Live(get_renderable=self._get_status_panel,
+                             auto_refresh=False)
+            self.live.__enter__()
+        if self.live or self.headless:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._refresh_task
+            self._refresh_task = None
+        self.__exit__(exc_type, exc_val, exc_tb)
+
+    async def _refresh_loop(self):
+        interval = self.headless.interval if self.headless else 1 / 4
+        while True:
+            await asyncio.sleep(interval)
+            if self.live:
+                self.live.refresh()
+            else:
+                self.headless.tick()
 
     def set_total_steps(self, total):
-        self.total_steps = total
+        with self._lock:
+            self.total_steps = total
+            self._emit({"event": "total_steps", "time": time.time(), "total": total})
         self._update_display()
 
     def start_step(self, step_name):
-        self.step_number += 1
-        self.current_step = step_name
-        self.step_data[step_name] = {}  # Initialize data storage for this step
-        print(
-            f"\n[bold blue]Starting Step {self.step_number}: {step_name}[/bold blue]")
+        with self._lock:
+            self.step_number += 1
+            step_number = self.step_number
+            # Data of finished steps already lives on in their completion lines
+            for name in list(self.step_data):
+                if name not in self.active_steps:
+                    del self.step_data[name]
+            self.current_step = step_name
+            self.active_steps[step_name] = step_number
+            self.step_data[step_name] = {}  # Initialize data storage for this step
+            self._step_timers[step_name] = StepTimer()
+            # Step events are emitted under the lock so they stay in step with snapshot()
+            self._emit({"event": "start", "time": time.time(),
+                       "step": step_name, "step_number": step_number})
+        # Print outside the lock, Live holds its own lock while pulling the panel
+        if self.mode == "rich":
+            print(
+                f"\n[bold blue]Starting Step {step_number}: {step_name}[/bold blue]")
         self._update_display()
 
-    def update_step_data(self, **data):
-        """Update data for the current step"""
-        if self.current_step:
-            self.step_data[self.current_step].update(data)
-            self._update_display()
+    def set_step_total(self, counter, total, step_name=None):
+        """Declare the expected final value of a step data counter, for rate and ETA
+
+        With total=None only the counter's rate is shown.
+        """
+        step_name = step_name or _task_step.get() or self.current_step
+        with self._lock:
+            self.progress.expect(step_name, counter, total)
+        self._update_display()
+
+    def update_step_data(self, step_name=None, **data):
+        """Update data for the current step, or for step_name if several are running"""
+        step_name = step_name or _task_step.get() or self.current_step
+        sinks = self._data_sinks()
+        with self._lock if sinks else contextlib.nullcontext():
+            if self._shards is not None:
+                self._shards.set(step_name, data)
+            elif step_name in self.step_data:
+                self.step_data[step_name].update(data)
+            for sink in sinks:
+                sink.event({"event": "update", "time": time.time(),
+                            "step": step_name, "data": data})
+        self._update_display()
+
+    def add_step_data(self, step_name=None, **increments):
+        """Add to numeric counters of the current step, or of step_name"""
+        step_name = step_name or _task_step.get() or self.current_step
+        sinks = self._data_sinks()
+        with self._lock if sinks else contextlib.nullcontext():
+            if self._shards is not None:
+                self._shards.add(step_name, increments)
+            elif step_name in self.step_data:
+                values = self.step_data[step_name]
+                for key, amount in increments.items():
+                    values[key] = values.get(key, 0) + amount
+            for sink in sinks:
+                sink.event({"event": "add", "time": time.time(),
+                            "step": step_name, "data": increments})
+        self._update_display()
+
+    def _data_sinks(self):
+        """Event sinks that consume step data events right now.
+
+        That is the journal, and the publisher while viewers are attached;
+        the headless backend covers step data with its snapshots. Data
+        updates take the tracker lock only when there are any, so a change
+        and its event happen together under the lock a viewer's greeting
+        snapshot is taken with (or an add could be both in the snapshot
+        and in the events after it), and stay lock-free otherwise. An
+        update racing a viewer's attach may be missed by that viewer; the
+        step's complete event carries its full data.
+        """
+        sinks = []
+        if self.journal:
+            sinks.append(self.journal)
+        if self.publisher and self.publisher.has_viewers:
+            sinks.append(self.publisher)
+        return sinks
+
+    def counter(self, key, step_name=None):
+        """Return a StepCounter adding to a data key of the current step (or step_name).
+
+        c.add(n) costs a single integer add; the panel picks the value up on
+        its next refresh. Use one handle per thread, they are summed.
+        """
+        step_name = step_name or _task_step.get() or self.current_step
+        counter = StepCounter()
+        with self._lock:
+            self._counters.setdefault(step_name, []).append((key, counter))
+        self._update_display()
+        return counter
 
     def complete_step(self, step_name=None, result=None, **final_data):
         """Complete step with optional final data and actual result"""
-        step_name = step_name or self.current_step
+        step_name = step_name or _task_step.get() or self.current_step
         timestamp = time.strftime('%H:%M:%S')
 
-        # Store the actual result data separately
+        with self._lock:
+            metrics = self._stop_timer(step_name, final_data)
+            self.progress.forget(step_name)
+
+            # Fold the per-thread data and counters into the step's own data
+            if self._shards is not None and step_name in self.step_data:
+                self.step_data[step_name].update(self._shards.pop(step_name))
+            counters = self._counters.pop(step_name, ())
+            self._counter_values.pop(step_name, None)
+            if step_name in self.step_data:
+                self._add_counters(self.step_data[step_name], counters)
+
+            # Add measured metrics and any final display data
+            if step_name in self.step_data:
+                self.step_data[step_name].update(metrics)
+                self.step_data[step_name].update(final_data)
+
+            # Create completion message with display data if available
+            completion_msg = f"✓ {step_name} completed at {timestamp}"
+            if step_name in self.step_data and self.step_data[step_name]:
+                data_summary = self._format_step_data(
+                    {key: value for key, value in self.step_data[step_name].items()
+                     if key not in _DETAIL_METRICS})
+                if data_summary:
+                    completion_msg += f" ({data_summary})"
+
+            self.active_steps.pop(step_name, None)
+            self.completed_steps.add(completion_msg, metrics.get("wall_time"))
+            self._emit({"event": "complete", "time": time.time(), "step": step_name,
+                        "data": dict(self.step_data.get(step_name, {}))})
+        # Store the actual result data separately, outside the lock: storing
+        # may spill results to disk, and the panel must not wait for that
         if result is not None:
             self.step_results[step_name] = result
+        if self.mode == "rich":
+            print(f"[bold green]{completion_msg}[/bold green]")
+        self._update_display()
 
-        # Add any final display data
-        if final_data and step_name in self.step_data:
-            self.step_data[step_name].update(final_data)
+        return result  # Return the result for chaining
 
-        # Create completion message with display data if available
-        completion_msg = f"✓ {step_name} completed at {timestamp}"
-        if step_name in self.step_data and self.step_data[step_name]:
-            data_summary = self._format_step_data(self.step_data[step_name])
-            if data_summary:
-                completion_msg += f" ({data_summary})"
+    def call_step(self, func, *inputs):
+        """Run func(self, *inputs) for the current step, reusing a cached result if possible"""
+        if self.step_cache is None:
+            return func(self, *inputs)
+
+        step_name = self.current_step
+        key = self.step_cache.key(step_name, func, inputs)
+        hit, result = self.step_cache.get(key)
+        if hit:
+            if self.mode == "rich":
+                print(f"  - Using cached result for {step_name}")
+            self.update_step_data(cache_hit=True)
+            return result
+
+        result = func(self, *inputs)
+        self.step_cache.put(key, result)
+        return result
+
+    def attach_progress_channel(self, channel):
+        """Show per-worker and total progress from a ProgressChannel in the panel"""
+        with self._lock:
+            self.progress_channels.append(channel)
+        self._update_display()
 
-        self.completed_steps.append(completion_msg)
-        print(f"[bold green]{completion_msg}[/bold green]")
+    def detach_progress_channel(self, channel):
+        with self._lock:
+            self.progress_channels.remove(channel)
         self._update_display()
 
-        return result  # Return the result for chaining
+    def snapshot(self, full=False):
+        """Return the current tracker state as a plain dict, e.g. for JSON output.
+
+        full adds what load_snapshot() needs to show the same panel elsewhere.
+        """
+        with self._lock:
+            active_steps = list(self.active_steps)
+            snapshot = {
+                "time": time.time(),
+                "current_step": self.current_step,
+                "active_steps": active_steps,
+                "step_number": self.step_number,
+                "total_steps": self.total_steps,
+                "completed": len(self.completed_steps),
+                "errors": self.errors,
+                "step_time": self.completed_steps.total_time,
+                "step_data": {name: self._current_step_data(name)
+                              for name in active_steps or [self.current_step]
+                              if name in self.step_data},
+            }
+            if self.progress_channels:
+                snapshot["workers"] = [channel.per_worker()
+                                       for channel in self.progress_channels]
+            if self.writer.files or self.writer.pending or self.writer.failures:
+                snapshot["output"] = {"files": self.writer.files,
+                                      "pending": self.writer.pending,
+                                      "bytes_written": self.writer.bytes_written,
+                                      "failures": self.writer.failures}
+            if full:
+                snapshot["failed"] = self.completed_steps.failed
+                snapshot["history"] = list(self.completed_steps.lines)
+                snapshot["step_metrics"] = dict(self.step_metrics.recent)
+                snapshot["hot_steps"] = dict(self.step_metrics.hot_steps)
+            return snapshot
+
+    def load_snapshot(self, snapshot):
+        """Take over the state of another tracker from its snapshot(full=True)"""
+        with self._lock:
+            self.current_step = snapshot["current_step"]
+            self.step_number = snapshot["step_number"]
+            self.total_steps = snapshot["total_steps"]
+            self.errors = snapshot["errors"]
+            self.active_steps = dict.fromkeys(
+                snapshot["active_steps"], snapshot["step_number"])
+            self.step_data = {name: dict(data)
+                              for name, data in snapshot["step_data"].items()}
+            self.step_metrics.load(snapshot["step_metrics"], snapshot["hot_steps"])
+            self.completed_steps.load(
+                snapshot["history"], snapshot["completed"],
+                snapshot["failed"], snapshot["step_time"])
+        self._update_display()
+
+    def _emit(self, record):
+        for sink in self._event_sinks:
+            sink.event(record)
+
+    def emit_counters(self):
+        """Send changed counter handle values to the event sinks as update events.
+
+        StepCounter.add() emits nothing, so this is called on every refresh
+        tick (panel, headless snapshot, socket send); otherwise journals and
+        viewers would only see counter progress once the step completes.
+        """
+        if not self._event_sinks or not self._counters:
+            return
+        with self._lock:
+            for step_name, counters in self._counters.items():
+                data = self._current_step_data(step_name)
+                if data is None:
+                    continue
+                sent = self._counter_values.setdefault(step_name, {})
+                changed = {key: data[key] for key, _ in counters
+                           if sent.get(key) != data[key]}
+                if changed:
+                    sent.update(changed)
+                    self._emit({"event": "update", "time": time.time(),
+                                "step": step_name, "data": changed})
 
     def get_step_result(self, step_name):
         """Get the actual result data from a completed step"""
         return self.step_results.get(step_name)
 
+    def _stop_timer(self, step_name, recorded=None):
+        """Stop the step's timer and record its metrics; {} if it wasn't running
+
+        Metrics given in `recorded` (the final data of a replayed or viewed
+        step) replace the ones measured here.
+        """
+        timer = self._step_timers.pop(step_name, None)
+        if timer is None:
+            return {}
+        metrics = timer.stop()
+        if recorded:
+            metrics.update({key: recorded[key] for key in metrics if key in recorded})
+        self.step_metrics.add(step_name, metrics)
+        return metrics
+
+    def hot_step(self, metric="wall_time"):
+        """Return (step name, value) of the finished step with the highest metric"""
+        return self.step_metrics.hot(metric)
+
     def _format_step_data(self, data):
         """Format step data for display"""
         if not data:
             return ""
-
-        formatted_parts = []
-        for key, value in data.items():
-            if key == "lines_processed":
-                formatted_parts.append(f"{value:,} lines")
-            elif key == "records_found":
-                formatted_parts.append(f"{value:,} records")
-            elif key == "output_file":
-                formatted_parts.append(f"saved to {value}")
-            elif key == "files_created":
-                formatted_parts.append(f"{value} files created")
-            elif key == "notifications_sent":
-                formatted_parts.append(f"{value} notifications sent")
-            elif key == "errors_found":
-                formatted_parts.append(f"{value} errors found")
-            elif key == "processing_time":
-                formatted_parts.append(f"{value:.2f}s")
-            elif key == "dataframe_shape":
-                formatted_parts.append(f"df: {value[0]}×{value[1]}")
-            elif key == "dataframe_memory":
-                formatted_parts.append(f"{value:.1f}MB")
-            elif key == "model_accuracy":
-                formatted_parts.append(f"accuracy: {value:.2%}")
-            else:
-                # Generic formatting for other data types
-                formatted_parts.append(f"{key}: {value}")
-
-        return ", ".join(formatted_parts)
-
-    def add_error(self):
-        self.errors += 1
+        # Copy first, a running step may add keys while the panel is built
+        return self.formatter.format(dict(data))
+
+    def add_error(self, step_name=None):
+        """Count an error, marking step_name (default: the current step) as no longer running"""
+        step_name = step_name or _task_step.get()
+        failed = step_name or self.current_step
+        with self._lock:
+            self.errors += 1
+            self._stop_timer(failed)
+            self.progress.forget(failed)
+            self._counters.pop(failed, None)
+            self._counter_values.pop(failed, None)
+            self.active_steps.pop(failed, None)
+            self.completed_steps.add_failure()
+            self._emit({"event": "error", "time": time.time(),
+                        "step": step_name, "current_step": self.current_step,
+                        "errors": self.errors})
         self._update_display()
 
+    def _step_remaining(self, step_name, estimates):
+        """Seconds left in a running step from its counters, else from the average step"""
+        remaining = self.progress.remaining(estimates)
+        timer = self._step_timers.get(step_name)
+        if remaining is None and timer is not None and self.completed_steps:
+            average = self.completed_steps.total_time / len(self.completed_steps)
+            remaining = max(average - timer.elapsed(), 0.0)
+        return remaining
+
+    def _current_step_data(self, step_name):
+        """Return the data of a step, merged across threads and counter handles"""
+        data = self.step_data.get(step_name)
+        counters = self._counters.get(step_name)
+        if data is None or (self._shards is None and not counters):
+            return data
+        if self._shards is not None:
+            data = {**data, **self._shards.snapshot(step_name)}
+        else:
+            data = dict(data)
+        if counters:
+            self._add_counters(data, counters)
+        return data
+
+    @staticmethod
+    def _add_counters(data, counters):
+        for key, counter in counters:
+            data[key] = data.get(key, 0) + counter.value
+
+    def _format_progress_channel(self, channel):
+        """Format worker progress as one line per worker plus a total"""
+        key = channel.counters[0]
+        per_worker = channel.per_worker()
+        total = sum(counts[key] for counts in per_worker)
+        expected = f"/{channel.expected_total:,}" if channel.expected_total else ""
+        workers = " | ".join(
+            f"#{i} {counts[key]:,}" for i, counts in enumerate(per_worker))
+        return f"Workers: {workers}\nTotal: {total:,}{expected} {key}"
+
+    def _format_result_store(self):
+        store = self.step_results
+        mb = 1024**2
+        return (f"Results: {store.memory_bytes / mb:.1f}MB in memory, "
+                f"{store.spills} spilled ({store.spilled_bytes / mb:.1f}MB), "
+                f"{store.reloads} reloaded ({store.reloaded_bytes / mb:.1f}MB)")
+
+    def _format_writer(self):
+        writer = self.writer
+        text = (f"Output: {writer.files} files, "
+                f"{writer.bytes_written / 1024**2:.1f}MB written")
+        if writer.throughput is not None:
+            text += f" at {writer.throughput / 1024**2:.1f}MB/s"
+        if writer.pending:
+            text += f", {writer.pending} pending"
+        if writer.failures:
+            text += f", {writer.failures} failed"
+        return text
+
     def _create_status_panel(self):
-        status_text = f"""Current Step: {self.current_step}
+        active_steps = list(self.active_steps)
+        if len(active_steps) > 1:
+            step_line = f"Running Steps: {', '.join(active_steps)}"
+        else:
+            step_line = f"Current Step: {self.current_step}"
+
+        status_text = f"""{step_line}
 Progress: {len(self.completed_steps)}/{self.total_steps} steps completed
 Errors: {self.errors}
+Step Time: {self.completed_steps.total_time:.2f}s
 Time: {time.strftime('%H:%M:%S')}"""
 
-        # Add current step data if available
-        if self.current_step and self.current_step in self.step_data:
-            current_data = self._format_step_data(
-                self.step_data[self.current_step])
+        hot_step, hot_time = self.hot_step()
+        if hot_step:
+            hot_metrics = self.step_metrics.recent.get(hot_step, {"wall_time": hot_time})
+            status_text += f"\nHot Step: {hot_step} ({self._format_step_data(hot_metrics)})"
+
+        # Add data of every running step (or the last step) if available
+        steps_remaining = []
+        for name in active_steps or [self.current_step]:
+            data = self._current_step_data(name)
+            current_data = self._format_step_data(data)
             if current_data:
-                status_text += f"\nCurrent Data: {current_data}"
+                label = name if len(active_steps) > 1 else "Current Data"
+                status_text += f"\n{label}: {current_data}"
+            # Rates are sampled here, once per rebuilt panel, not on every update
+            estimates = self.progress.estimate(name, data)
+            if estimates:
+                label = f"{name} Progress" if len(active_steps) > 1 else "Step Progress"
+                status_text += f"\n{label}: {self.progress.format(estimates)}"
+            if name in self.active_steps:
+                steps_remaining.append(self._step_remaining(name, estimates))
+
+        if steps_remaining and None not in steps_remaining:
+            remaining = run_remaining(
+                max(steps_remaining), self.total_steps, len(self.completed_steps),
+                len(active_steps), self.completed_steps.total_time)
+            if remaining is not None:
+                status_text += f"\nRun ETA: {format_duration(remaining)} left"
+
+        if self.step_cache is not None:
+            status_text += (f"\nCache: {self.step_cache.hits} hits, "
+                            f"{self.step_cache.misses} misses")
+
+        if self.step_results.memory_budget is not None:
+            status_text += "\n" + self._format_result_store()
+
+        for channel in self.progress_channels:
+            status_text += "\n" + self._format_progress_channel(channel)
+
+        if self.writer.files or self.writer.pending or self.writer.failures:
+            status_text += "\n" + self._format_writer()
 
         if self.completed_steps:
-            status_text += "\n\nCompleted Steps:"
-            # Show last 5 completed steps to avoid panel getting too large
-            for step in self.completed_steps[-5:]:
-                status_text += f"\n{step}"
-            if len(self.completed_steps) > 5:
-                status_text += f"\n... and {len(self.completed_steps) - 5} more"
-
-        return Panel(status_text, title="Processing Status", border_style="blue", height=20)
+            # Only the last 5 completed steps are kept, rendered once per new step
+            status_text += "\n\n" + self.completed_steps.render()
+
+        # No fixed height: the panel grows with its lines instead of cutting off the newest
+        return Panel(status_text, title="Processing Status", border_style="blue")
+
+    def _get_status_panel(self):
+        """Return the status panel, rebuilding it only if state changed since the last tick"""
+        now = time.strftime('%H:%M:%S')
+        # Worker processes and counter handles don't set the dirty flag, so poll
+        if (self._dirty or self._panel is None or now != self._panel_time
+                or self.progress_channels or self._counters):
+            # Clear the flag before building so updates made meanwhile are not lost
+            self._dirty = False
+            self._panel_time = now
+            # Build from a consistent view of the steps; counters are not locked
+            with self._lock:
+                self._panel = self._create_status_panel()
+            self.emit_counters()
+        return self._panel
 
     def _update_display(self):
-        if self.live:
-            self.live.update(self._create_status_panel())
+        # Only mark state as changed; the panel is built once per refresh tick
+        self._dirty = True
 
 
 # Example step functions with real data passing
 
 
-def load_data(status: StatusTracker):
+def load_data(status: StatusTracker, rows=1000):
     """Step 1: Load data and return DataFrame"""
     print("  - Reading CSV file...")
     time.sleep(1)
 
     # Simulate loading a DataFrame
     data = {
-        'id': range(1, 1001),
-        'value': np.random.randn(1000),
-        'category': np.random.choice(['A', 'B', 'C'], 1000),
-        'timestamp': pd.date_range('2024-01-01', periods=1000, freq='H')
+        'id': range(1, rows + 1),
+        'value': np.random.randn(rows),
+        'category': np.random.choice(['A', 'B', 'C'], rows),
+        'timestamp': pd.date_range('2024-01-01', periods=rows, freq='H')
     }
     df = pd.DataFrame(data)
 
@@ -189,23 +631,92 @@ def load_data(status: StatusTracker):
     return df  # Return the actual DataFrame
 
 
+def generate_chunks(total_rows=1000, chunk_size=250):
+    """Yield the simulated input as DataFrames of at most chunk_size rows.
+
+    Any iterator of DataFrames works as input for load_data_streaming, e.g.
+    pd.read_csv(path, chunksize=chunk_size) for real files.
+    """
+    for start in range(0, total_rows, chunk_size):
+        rows = min(chunk_size, total_rows - start)
+        yield pd.DataFrame({
+            'id': range(start + 1, start + rows + 1),
+            'value': np.random.randn(rows),
+            'category': np.random.choice(['A', 'B', 'C'], rows),
+            'timestamp': pd.date_range(
+                pd.Timestamp('2024-01-01') + pd.Timedelta(hours=start),
+                periods=rows, freq='H')
+        })
+
+
+def load_data_streaming(status, chunks, total_rows=None):
+    """Steps 1+2 (streaming): load chunks and process each one as it arrives
+
+    Yields processed chunks, so only one raw chunk is held in memory at a time.
+    The rows/s rate is always shown; pass total_rows, if known, to also show
+    the time remaining.
+    """
+    print("  - Streaming input in chunks...")
+    status.set_step_total("lines_processed", total_rows)
+    lines_processed = 0
+    records_after_cleaning = 0
+    high_values = 0
+
+    for chunk in chunks:
+        processed = clean_data(chunk)
+        lines_processed += len(chunk)
+        records_after_cleaning += len(processed)
+        high_values += int((processed['value'] > 0.5).sum())
+        status.update_step_data(
+            lines_processed=lines_processed,
+            records_after_cleaning=records_after_cleaning,
+            high_value_records=high_values
+        )
+        yield processed
+
+    print(f"  - Streamed {lines_processed:,} records")
+    log.info(f"Streaming load complete: {lines_processed} rows, "
+             f"{records_after_cleaning} clean records")
+
+
+def compact_data(status, df):
+    """Step 1b (opt-in): shrink the loaded frame's dtypes before processing
+
+    Later steps then work on (and keep in the result store) the compact frame.
+    """
+    print("  - Compacting column types...")
+    before = memory_usage(df)
+    df_compact = compact_dtypes(df)
+    after = memory_usage(df_compact)
+
+    status.update_step_data(
+        memory_before=before / 1024**2,
+        memory_after=after / 1024**2,
+        memory_reduction=before / after if after else 1.0
+    )
+
+    print(f"  - Memory {before / 1024**2:.2f}MB -> {after / 1024**2:.2f}MB")
+    log.info(f"Compacted dtypes: {', '.join(f'{name}={dtype}' for name, dtype in df_compact.dtypes.items())}")
+
+    return df_compact
+
+
+def clean_data(df):
+    """Drop missing values and add the registered computed columns (see derived_columns.py)"""
+    return add_derived_columns(df.dropna())
+
+
 def process_data(status, df):
     """Step 2: Process the DataFrame and return processed data"""
     print("  - Cleaning data...")
     time.sleep(0.5)
 
-    # Remove any missing values
-    df_clean = df.dropna()
-    status.update_step_data(records_after_cleaning=len(df_clean))
-
     print("  - Computing statistics...")
     time.sleep(0.8)
 
-    # Add some computed columns
-    df_clean['value_squared'] = df_clean['value'] ** 2
-    df_clean['value_category'] = df_clean['value'].apply(
-        lambda x: 'high' if x > 0.5 else 'low' if x < -0.5 else 'medium'
-    )
+    # Remove any missing values and add computed columns
+    df_clean = clean_data(df)
+    status.update_step_data(records_after_cleaning=len(df_clean))
 
     # Simulate some processing metrics
     high_values = (df_clean['value'] > 0.5).sum()
@@ -220,18 +731,69 @@ def process_data(status, df):
     return df_clean  # Return the processed DataFrame
 
 
-def analyze_data(status, df):
-    """Step 3: Analyze data and return results"""
+def process_data_parallel(status, df, workers=4):
+    """Step 2 (parallel): Process partitions of the DataFrame in worker processes"""
+    print(f"  - Processing {workers} partitions in worker processes...")
+    channel = ProgressChannel(workers, expected_total=len(df))
+    size = max(1, -(-len(df) // workers))  # Ceiling division; 1 for an empty frame
+    # An empty frame still goes through one worker, so the result has all columns
+    partitions = [df.iloc[start:start + size]
+                  for start in range(0, len(df), size)] or [df]
+
+    status.attach_progress_channel(channel)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=channel.context,
+                                 initializer=channel.initializer,
+                                 initargs=channel.initargs) as pool:
+            df_clean = pd.concat(pool.map(process_partition, partitions))
+    finally:
+        status.detach_progress_channel(channel)
+
+    high_values = (df_clean['value'] > 0.5).sum()
+    status.update_step_data(
+        records_after_cleaning=len(df_clean),
+        high_value_records=high_values,
+        categories_found=df_clean['category'].nunique()
+    )
+
+    print(f"  - Found {high_values} high-value records")
+    log.info(f"Parallel processing complete: {len(df_clean)} clean records")
+
+    return df_clean
+
+
+def analyze_data(status, df, workers=None):
+    """Step 3: Analyze data and return results
+
+    All statistics come from one pass over partitions of the frame, reduced
+    in up to `workers` processes (default: one per CPU) and merged; see
+    mergeable_stats.py. Quartiles in summary_stats are approximate for
+    partitions larger than the quantile sketch.
+    """
     print("  - Running statistical analysis...")
     time.sleep(1.2)
 
     # Perform analysis
+    stats = analyze_partitions(
+        df, category='category', correlation_columns=['value', 'value_squared'],
+        workers=workers or os.cpu_count() or 1)
+    return _report_analysis(status, stats)
+
+
+def analyze_streamed(status, partial):
+    """Step 3 (streaming): finish the statistics merged while the chunks were saved"""
+    print("  - Running statistical analysis...")
+    return _report_analysis(status, finalize(partial, ['value', 'value_squared']))
+
+
+def _report_analysis(status, stats):
+    """Pick the analysis results out of finalized statistics and show them"""
     analysis_results = {
-        'mean_value': df['value'].mean(),
-        'std_value': df['value'].std(),
-        'category_counts': df['category'].value_counts().to_dict(),
-        'correlation_matrix': df[['value', 'value_squared']].corr(),
-        'summary_stats': df.describe()
+        'mean_value': stats['mean']['value'],
+        'std_value': stats['std']['value'],
+        'category_counts': stats['category_counts'],
+        'correlation_matrix': stats['correlation_matrix'],
+        'summary_stats': stats['summary_stats']
     }
 
     # Update status with analysis metadata
@@ -248,29 +810,85 @@ def analyze_data(status, df):
     return analysis_results  # Return the analysis results
 
 
-def save_results(status, df, analysis):
-    """Step 4: Save data and analysis results"""
+def _log_write_failure(path):
+    def done(future):
+        if future.exception() is not None:
+            log.error(f"Writing {path} failed: {future.exception()}")
+    return done
+
+
+def save_data_file(status, df, format=None):
+    """Start saving the processed DataFrame and return the file name
+
+    The file is written on the tracker's background writer (parquet if
+    pyarrow is installed, else npz; or format="csv") and appears under its
+    name once complete.
+    """
     print("  - Saving processed data...")
-    time.sleep(0.6)
+    format = format or default_format()
+
+    output_file = f"processed_data_{time.strftime('%Y%m%d_%H%M%S')}{EXTENSIONS[format]}"
+    status.writer.write_frame(df, output_file, format).add_done_callback(
+        _log_write_failure(output_file))
+
+    status.update_step_data(data_file=output_file, records_saved=len(df))
+    return output_file
 
-    # Save DataFrame (simulated)
-    output_file = f"processed_data_{time.strftime('%Y%m%d_%H%M%S')}.csv"
-    # df.to_csv(output_file, index=False)  # Uncomment for real saving
 
+def save_chunks(status, chunks, category='category'):
+    """Step 4 (streaming): append processed chunks to a CSV file as they arrive
+
+    Each chunk is also reduced to partial statistics (see mergeable_stats.py)
+    and then dropped, so memory use stays flat however long the input is.
+    The file is written under a temporary name and renamed into place after
+    the last chunk. Returns the file name and the merged statistics.
+    """
+    print("  - Saving processed chunks...")
+    output_file = f"processed_data_{time.strftime('%Y%m%d_%H%M%S')}.csv"
+    temporary = f"{output_file}.tmp"
+    stats = None
+    records_saved = 0
+    try:
+        with open(temporary, "w", newline="", encoding="utf-8") as f:
+            for chunk in chunks:
+                chunk.to_csv(f, header=stats is None, index=False)
+                partial = partial_stats(chunk, *describe_columns(chunk), category)
+                stats = partial if stats is None else merge_stats(stats, partial)
+                records_saved += len(chunk)
+                status.update_step_data(records_saved=records_saved)
+        if stats is None:
+            raise ValueError("The input had no chunks")
+        os.replace(temporary, output_file)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+    status.update_step_data(data_file=output_file)
+    log.info(f"Processed data saved: {output_file}")
+    return output_file, stats
+
+
+def save_analysis_file(status, analysis):
+    """Start saving the analysis results as JSON and return the file name"""
     print("  - Saving analysis results...")
-    time.sleep(0.4)
 
-    # Save analysis (simulated)
     analysis_file = f"analysis_results_{time.strftime('%Y%m%d_%H%M%S')}.json"
-    # import json
-    # with open(analysis_file, 'w') as f:
-    #     json.dump({k: v for k, v in analysis.items() if k != 'correlation_matrix'}, f, indent=2)
+    status.writer.write_json(analysis, analysis_file).add_done_callback(
+        _log_write_failure(analysis_file))
+
+    status.update_step_data(analysis_file=analysis_file)
+    return analysis_file
 
-    status.update_step_data(
-        data_file=output_file,
-        analysis_file=analysis_file,
-        records_saved=len(df)
-    )
+
+def save_results(status, df, analysis, format=None):
+    """Step 4: Save data and analysis results
+
+    Both files are written in the background, so this returns right away;
+    the tracker waits for the writes when it exits.
+    """
+    output_file = save_data_file(status, df, format)
+    analysis_file = save_analysis_file(status, analysis)
 
     print(f"  - Saved {len(df):,} records to {output_file}")
     log.info(f"Results saved: {output_file}, {analysis_file}")
@@ -286,6 +904,26 @@ def save_results(status, df, analysis):
 
 def step(name):
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            async def async_wrapper(*args, **kwargs):
+                status = getattr(async_wrapper, '_status_tracker', None)
+                if status is None:
+                    return await func(*args, **kwargs)
+                status.start_step(name)
+                # Only this task sees the step, others keep their own
+                token = _task_step.set(name)
+                try:
+                    result = await func(*args, **kwargs)
+                    status.complete_step(name)
+                    return result
+                except Exception as e:
+                    log.error(f"Error in {name}: {e}")
+                    status.add_error(name)
+                    raise
+                finally:
+                    _task_step.reset(token)
+            return async_wrapper
+
         def wrapper(*args, **kwargs):
             if hasattr(wrapper, '_status_tracker'):
                 wrapper._status_tracker.start_step(name)
@@ -295,7 +933,7 @@ def step(name):
                     return result
                 except Exception as e:
                     log.error(f"Error in {name}: {e}")
-                    wrapper._status_tracker.add_error()
+                    wrapper._status_tracker.add_error(name)
                     raise
             else:
                 return func(*args, **kwargs)
@@ -318,29 +956,79 @@ def do_that_decorated():
     time.sleep(0.8)
     log.info("Database connection established")
 
+
+# Decorated coroutine steps, for I/O-bound work running concurrently on one event loop
+
+
+@step("Fetch Records")
+async def fetch_records_async(status):
+    print("  - Connecting to database...")
+    await asyncio.sleep(0.8)
+    log.info("Database connection established")
+
+    records_found = 0
+    for page in range(10):  # Simulate paged fetching
+        await asyncio.sleep(0.12)
+        records_found += 150 + page * 10
+        status.update_step_data(records_found=records_found)
+    log.info(f"Retrieved {records_found:,} records")
+    return records_found
+
+
+@step("Generate Reports")
+async def generate_reports_async(status):
+    print("  - Generating reports...")
+    for files_created in range(1, 4):
+        await asyncio.sleep(0.6)
+        status.update_step_data(files_created=files_created)
+    log.info(f"Reports generated - {files_created} files created")
+    return files_created
+
+
+@step("Send Notifications")
+async def send_notifications_async(status, users=5):
+    print("  - Sending notifications...")
+    for notifications_sent in range(1, users + 1):
+        await asyncio.sleep(0.3)
+        status.update_step_data(notifications_sent=notifications_sent)
+    log.info(f"Notifications sent to {users} users")
+    return users
+
 # Usage example - Passing real data between steps
 
 
-def main():
+def main(compact=False):
+    """Pass compact=True to shrink the loaded frame's dtypes before processing"""
     with StatusTracker() as status:
-        status.set_total_steps(4)
+        status.set_total_steps(5 if compact else 4)
 
         # Step 1: Load data
         status.start_step("Load Data")
         try:
             df = load_data(status)
-            status.complete_step(result=df, processing_time=1.5)
+            status.complete_step(result=df)
         except Exception as e:
             log.error(f"Error in step 1: {e}")
             status.add_error()
             return
 
+        # Optional step: compact the frame so later steps work on smaller dtypes
+        if compact:
+            status.start_step("Compact Data")
+            try:
+                df = compact_data(status, df)
+                status.complete_step(result=df)
+            except Exception as e:
+                log.error(f"Error compacting data: {e}")
+                status.add_error()
+                return
+
         # Step 2: Process the data from step 1
         status.start_step("Process Data")
         try:
             # Pass DataFrame from step 1
             processed_df = process_data(status, df)
-            status.complete_step(result=processed_df, processing_time=1.3)
+            status.complete_step(result=processed_df)
         except Exception as e:
             log.error(f"Error in step 2: {e}")
             status.add_error()
@@ -351,7 +1039,7 @@ def main():
         try:
             analysis_results = analyze_data(
                 status, processed_df)  # Pass processed DataFrame
-            status.complete_step(result=analysis_results, processing_time=1.2)
+            status.complete_step(result=analysis_results)
         except Exception as e:
             log.error(f"Error in step 3: {e}")
             status.add_error()
@@ -362,7 +1050,7 @@ def main():
         try:
             save_info = save_results(
                 status, processed_df, analysis_results)  # Pass both
-            status.complete_step(result=save_info, processing_time=1.0)
+            status.complete_step(result=save_info)
         except Exception as e:
             log.error(f"Error in step 4: {e}")
             status.add_error()
@@ -382,35 +1070,78 @@ def main():
 
 
 class DataContext:
-    def __init__(self):
-        self.raw_data = None
-        self.processed_data = None
-        self.analysis_results = None
-        self.save_info = None
-
-
-def main_with_context():
-    """Alternative approach using a shared context object"""
-    with StatusTracker() as status:
-        status.set_total_steps(4)
-        context = DataContext()
+    """Named access to step results, read from the tracker's result store
+
+    The context holds no references itself, so results the store spills to
+    disk really leave memory and are reloaded when accessed.
+    """
+
+    def __init__(self, status):
+        self._status = status
+
+    @property
+    def raw_data(self):
+        """The loaded frame, compacted if the Compact Data step ran"""
+        compacted = self._status.get_step_result("Compact Data")
+        if compacted is not None:
+            return compacted
+        return self._status.get_step_result("Load Data")
+
+    @property
+    def processed_data(self):
+        return self._status.get_step_result("Process Data")
+
+    @property
+    def analysis_results(self):
+        return self._status.get_step_result("Analyze Data")
+
+    @property
+    def save_info(self):
+        return self._status.get_step_result("Save Results")
+
+
+def main_with_context(cache_dir=None, journal_file=None, socket_path=None,
+                      compact=False):
+    """Alternative approach using a shared context object
+
+    Pass cache_dir (e.g. ".step_cache") to reuse step results from earlier
+    runs whose code and inputs are unchanged, journal_file (e.g.
+    "step_journal.jsonl") to record the run for `step_journal.py replay`,
+    socket_path (e.g. "/tmp/richtest.sock") to watch it from
+    `status_socket.py` instead of rendering the panel here, and compact=True
+    to shrink the loaded frame's dtypes before processing.
+    """
+    # Results beyond the memory budget are spilled to disk until needed again
+    with StatusTracker(result_memory_mb=256, cache_dir=cache_dir,
+                       journal_file=journal_file, socket_path=socket_path) as status:
+        status.set_total_steps(5 if compact else 4)
+        context = DataContext(status)
 
         # Step 1
         status.start_step("Load Data")
         try:
-            context.raw_data = load_data(status)
-            status.complete_step(result=context.raw_data, processing_time=1.5)
+            status.complete_step(result=status.call_step(load_data))
         except Exception as e:
             log.error(f"Error loading data: {e}")
             status.add_error()
             return
 
+        # Optional step: later steps pick up the compact frame through context.raw_data
+        if compact:
+            status.start_step("Compact Data")
+            try:
+                status.complete_step(
+                    result=status.call_step(compact_data, context.raw_data))
+            except Exception as e:
+                log.error(f"Error compacting data: {e}")
+                status.add_error()
+                return
+
         # Step 2
         status.start_step("Process Data")
         try:
-            context.processed_data = process_data(status, context.raw_data)
             status.complete_step(
-                result=context.processed_data, processing_time=1.3)
+                result=status.call_step(process_data, context.raw_data))
         except Exception as e:
             log.error(f"Error processing data: {e}")
             status.add_error()
@@ -419,10 +1150,8 @@ def main_with_context():
         # Step 3
         status.start_step("Analyze Data")
         try:
-            context.analysis_results = analyze_data(
-                status, context.processed_data)
             status.complete_step(
-                result=context.analysis_results, processing_time=1.2)
+                result=status.call_step(analyze_data, context.processed_data))
         except Exception as e:
             log.error(f"Error analyzing data: {e}")
             status.add_error()
@@ -431,9 +1160,9 @@ def main_with_context():
         # Step 4
         status.start_step("Save Results")
         try:
-            context.save_info = save_results(
+            save_info = save_results(
                 status, context.processed_data, context.analysis_results)
-            status.complete_step(result=context.save_info, processing_time=1.0)
+            status.complete_step(result=save_info)
         except Exception as e:
             log.error(f"Error saving results: {e}")
             status.add_error()
@@ -443,6 +1172,109 @@ def main_with_context():
         print(f"Final DataFrame shape: {context.processed_data.shape}")
         time.sleep(2)
 
+# Alternative: Step graph running independent steps in parallel
+
+
+def main_graph():
+    """Alternative approach declaring step inputs and letting run_graph schedule them"""
+    steps = [
+        GraphStep("Load Data", load_data),
+        GraphStep("Process Data", process_data, inputs=["Load Data"]),
+        GraphStep("Analyze Data", analyze_data, inputs=["Process Data"]),
+        # Saving the data only needs the processed frame, so it overlaps with analysis
+        GraphStep("Save Data", save_data_file, inputs=["Process Data"]),
+        GraphStep("Save Analysis", save_analysis_file,
+                  inputs=["Analyze Data"]),
+    ]
+
+    with StatusTracker(concurrent=True) as status:
+        status.set_total_steps(len(steps))
+        results = run_graph(status, steps)
+
+        if len(results) == len(steps):
+            print("\n[bold green]All steps completed![/bold green]")
+            print(f"Final DataFrame shape: {results['Process Data'].shape}")
+        time.sleep(2)
+
+# Alternative: Fan processing out to worker processes
+
+
+def main_parallel(rows=2_000_000, workers=4):
+    """Load a larger frame and process it on several cores with live worker progress"""
+    with StatusTracker() as status:
+        status.set_total_steps(2)
+
+        status.start_step("Load Data")
+        try:
+            df = load_data(status, rows=rows)
+            status.complete_step(result=df)
+        except Exception as e:
+            log.error(f"Error loading data: {e}")
+            status.add_error()
+            return
+
+        status.start_step("Process Data")
+        try:
+            processed_df = process_data_parallel(status, df, workers=workers)
+            status.complete_step(result=processed_df)
+        except Exception as e:
+            log.error(f"Error processing data: {e}")
+            status.add_error()
+            return
+
+        print("\n[bold green]All steps completed![/bold green]")
+        print(f"Final DataFrame shape: {processed_df.shape}")
+        time.sleep(2)
+
+# Alternative: Streaming load for inputs too large to read at once
+
+
+def main_streaming(total_rows=100_000, chunk_size=10_000):
+    """Load, process and save the input chunk by chunk, then analyze and save
+
+    Memory use stays flat however large total_rows is: neither the raw nor
+    the processed frame is ever held as a whole, and the analysis is merged
+    from per-chunk statistics.
+    """
+    with StatusTracker() as status:
+        status.set_total_steps(3)
+
+        # Step 1: Each chunk is processed, saved and summarized as it
+        # arrives, and then dropped
+        status.start_step("Load, Process & Save Data")
+        try:
+            data_file, stats = save_chunks(status, load_data_streaming(
+                status, generate_chunks(total_rows, chunk_size), total_rows))
+            status.complete_step(result=data_file)
+        except Exception as e:
+            log.error(f"Error loading data: {e}")
+            status.add_error()
+            return
+
+        # Step 2
+        status.start_step("Analyze Data")
+        try:
+            analysis_results = analyze_streamed(status, stats)
+            status.complete_step(result=analysis_results)
+        except Exception as e:
+            log.error(f"Error analyzing data: {e}")
+            status.add_error()
+            return
+
+        # Step 3
+        status.start_step("Save Results")
+        try:
+            analysis_file = save_analysis_file(status, analysis_results)
+            status.complete_step(result=analysis_file)
+        except Exception as e:
+            log.error(f"Error saving results: {e}")
+            status.add_error()
+            return
+
+        print("\n[bold green]All steps completed![/bold green]")
+        print(f"Processed data saved to {data_file}")
+        time.sleep(2)
+
 # Alternative usage with decorators
 
 
@@ -462,7 +1294,27 @@ def main_decorated():
         time.sleep(2)
 
 
+async def main_async():
+    """Run I/O-bound coroutine steps concurrently with a live panel"""
+    async with StatusTracker() as status:
+        steps = [fetch_records_async, generate_reports_async,
+                 send_notifications_async]
+        status.set_total_steps(len(steps))
+        for step_func in steps:
+            step_func._status_tracker = status
+
+        results = await asyncio.gather(*(step_func(status) for step_func in steps))
+
+        print("\n[bold green]All steps completed![/bold green]")
+        print(f"Results: {results}")
+        await asyncio.sleep(2)
+
+
 if __name__ == "__main__":
     # main()  # or main_with_context() for context approach
     # main_decorated()  # or main_decorated() for decorator approach
+    # main_streaming()  # or main_streaming() for chunked loading
+    # main_graph()  # or main_graph() for parallel independent steps
+    # main_parallel()  # or main_parallel() for processing in worker processes
+    # asyncio.run(main_async())  # for concurrent coroutine steps
     main_with_context()
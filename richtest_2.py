@@ -5,20 +5,23 @@ from rich.layout import Layout
 from rich.text import Text
 import time
 import threading
-from collections import deque
+from log_store import LogStore
 
 console = Console()
 
 
 class TopStatusDisplay:
-    def __init__(self, max_log_lines=20):
+    def __init__(self, max_log_lines=None):
         self.status_info = {
             'operation': 'Starting...',
             'processed': 0,
             'errors': 0,
             'start_time': time.time()
         }
-        self.log_buffer = deque(maxlen=max_log_lines)
+        # Every log line is kept (up to max_log_lines), only the visible ones are rendered
+        self.logs = LogStore(max_lines=max_log_lines)
+        self.log_top = None  # First visible log line, None to follow new lines
+        self.search_term = None  # Highlighted in the log pane
         self.layout = Layout()
 
         self.size = 10  # Height of the status panel
@@ -34,7 +37,42 @@ class TopStatusDisplay:
 
     def log(self, message):
         timestamp = time.strftime('%H:%M:%S')
-        self.log_buffer.append(f"[{timestamp}] {message}")
+        first, *rest = message.split("\n")
+        self.logs.append(f"[{timestamp}] {first}")
+        for line in rest:
+            self.logs.append(line)
+
+    def _log_height(self):
+        return max(1, console.size.height - self.size)
+
+    def _last_top(self):
+        return max(0, len(self.logs) - self._log_height())
+
+    def scroll(self, lines):
+        """Scroll the log pane; negative goes up towards older lines"""
+        last_top = self._last_top()
+        top = last_top if self.log_top is None else self.log_top
+        top = max(0, top + lines)
+        # Scrolling back to the bottom resumes following new lines
+        self.log_top = None if top >= last_top else top
+
+    def scroll_to_end(self):
+        self.log_top = None
+
+    def search(self, text, reverse=True):
+        """Scroll to the next line containing text, older lines first by default.
+
+        Returns the line index, or None (without scrolling) if there is none.
+        """
+        self.search_term = text
+        top = self._last_top() if self.log_top is None else self.log_top
+        start = top - 1 if reverse else top + 1
+        index = self.logs.search(text, start, reverse=reverse)
+        if index is not None:
+            self.log_top = min(index, self._last_top())
+            if self.log_top == self._last_top():
+                self.log_top = None
+        return index
 
     def get_layout(self):
         # Status panel
@@ -48,8 +86,14 @@ class TopStatusDisplay:
             border_style="green"
         )
 
-        # Logs
-        log_text = Text("\n".join(self.log_buffer))
+        # Logs: only the lines that fit in the pane, one row each; wrapped
+        # lines would push the newest ones off the bottom
+        height = self._log_height()
+        top = self._last_top() if self.log_top is None else self.log_top
+        log_text = Text("\n".join(self.logs.window(top, height)),
+                        no_wrap=True, overflow="ellipsis")
+        if self.search_term:
+            log_text.highlight_words([self.search_term], style="reverse")
 
         self.layout["status"].update(status_panel)
         self.layout["logs"].update(log_text)
@@ -79,6 +123,11 @@ def main():
             live.update(display.get_layout())
             time.sleep(0.2)
 
+        # The whole history stays available, e.g. jump back to an earlier batch
+        display.search("Starting batch 42")
+        live.update(display.get_layout())
+        time.sleep(2)
+
 
 if __name__ == "__main__":
     main()
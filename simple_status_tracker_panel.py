@@ -1,35 +1,51 @@
 from rich.live import Live
 from rich.panel import Panel
 from rich import print
+import threading
 import time
+from log_setup import flush_logging
+from step_history import StepHistory
 
 
 class StatusTracker:
-    def __init__(self, title="Current Status"):
+    def __init__(self, title="Current Status", history_file=None):
         self.title = title
         self.current_step = ""
         self.step_number = 0
         self.total_steps = 0
         self.errors = 0
-        self.completed_steps = []
+        # Bounded display history; pass history_file to keep every completed step on disk
+        self.completed_steps = StepHistory(history_file=history_file)
         self.live = None
+        # Guards the step state against the Live refresh thread building the panel
+        self._lock = threading.RLock()
+        self._dirty = True  # Set by every state change, cleared when the panel is rebuilt
+        self._panel = None
+        self._panel_time = None
 
     def __enter__(self):
-        self.live = Live(self._create_status_panel(), refresh_per_second=4)
+        # Live pulls the panel on each refresh tick instead of having it pushed on every update
+        self.live = Live(get_renderable=self._get_status_panel,
+                         refresh_per_second=4)
         self.live.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        # Drain queued log records while the panel is still live
+        flush_logging()
         if self.live:
             self.live.__exit__(exc_type, exc_val, exc_tb)
+        self.completed_steps.close()
 
     def set_total_steps(self, total):
-        self.total_steps = total
+        with self._lock:
+            self.total_steps = total
         self._update_display()
 
     def start_step(self, step_name):
-        self.step_number += 1
-        self.current_step = step_name
+        with self._lock:
+            self.step_number += 1
+            self.current_step = step_name
         print(
             f"\n[bold blue]Starting Step {self.step_number}: {step_name}[/bold blue]")
         self._update_display()
@@ -37,12 +53,15 @@ class StatusTracker:
     def complete_step(self, step_name=None):
         step_name = step_name or self.current_step
         timestamp = time.strftime('%H:%M:%S')
-        self.completed_steps.append(f"✓ {timestamp} - {step_name} completed!")
+        with self._lock:
+            self.completed_steps.add(f"✓ {timestamp} - {step_name} completed!")
         print(f"[bold green]✓ Completed: {step_name}[/bold green]")
         self._update_display()
 
     def add_error(self):
-        self.errors += 1
+        with self._lock:
+            self.errors += 1
+            self.completed_steps.add_failure()
         self._update_display()
 
     def _create_status_panel(self):
@@ -52,15 +71,23 @@ Errors: {self.errors}
 Time: {time.strftime('%H:%M:%S')}"""
 
         if self.completed_steps:
-            status_text += "\n\nCompleted Steps:"
-            # Show last 5 completed steps to avoid panel getting too large
-            for step in self.completed_steps[-5:]:
-                status_text += f"\n{step}"
-            if len(self.completed_steps) > 5:
-                status_text += f"\n... and {len(self.completed_steps) - 5} more"
+            # Only the last 5 completed steps are kept, rendered once per new step
+            status_text += "\n\n" + self.completed_steps.render()
 
         return Panel(status_text, title=self.title, border_style="blue")
 
+    def _get_status_panel(self):
+        """Return the status panel, rebuilding it only if state changed since the last tick"""
+        now = time.strftime('%H:%M:%S')
+        if self._dirty or self._panel is None or now != self._panel_time:
+            # Clear the flag before building so updates made meanwhile are not lost
+            self._dirty = False
+            self._panel_time = now
+            # Build from a consistent view of the steps
+            with self._lock:
+                self._panel = self._create_status_panel()
+        return self._panel
+
     def _update_display(self):
-        if self.live:
-            self.live.update(self._create_status_panel())
+        # Only mark state as changed; the panel is built once per refresh tick
+        self._dirty = True
@@ -0,0 +1,156 @@
+"""Watch a running job's status panel from another process.
+
+A StatusTracker created with socket_path publishes its state over a Unix
+domain socket: every viewer first gets a full snapshot, then the step
+events (start, update, complete, ...) as small JSON-line deltas. All Rich
+rendering happens in the viewer, and viewers can attach and detach while
+the job runs.
+
+    python status_socket.py /tmp/richtest.sock
+"""
+import argparse
+import json
+import os
+import socket
+import threading
+
+from headless_backend import json_default
+from step_journal import apply_event
+
+
+class _Viewer:
+    def __init__(self, conn, start_seq, greeting):
+        self.conn = conn
+        self.start_seq = start_seq  # Events up to this one are in the greeting snapshot
+        self.greeting = greeting
+
+
+class StatusPublisher:
+    """Serves a tracker's snapshot and event stream to viewers on a Unix socket.
+
+    Events are serialized on the calling thread (and only while a viewer is
+    attached); a background thread sends whatever is pending every
+    `send_interval` seconds, so a slow viewer never blocks the job.
+    """
+
+    def __init__(self, tracker, path, send_interval=0.1):
+        self.tracker = tracker
+        self.path = path
+        self.send_interval = send_interval
+        if os.path.exists(path):
+            os.unlink(path)  # Left behind by a job that didn't exit cleanly
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(path)
+        self._server.listen()
+        self._server.settimeout(send_interval)
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._pending = []  # (seq, encoded line) not yet sent
+        self._viewers = []
+        self._stop = threading.Event()
+        self._threads = [
+            threading.Thread(target=self._accept_loop, name="status-accept", daemon=True),
+            threading.Thread(target=self._send_loop, name="status-send", daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def has_viewers(self):
+        return bool(self._viewers)
+
+    def event(self, record):
+        if not self._viewers:
+            return  # Nobody watching; a new viewer starts from a snapshot anyway
+        line = json.dumps(record, default=json_default,
+                          separators=(",", ":")).encode() + b"\n"
+        with self._lock:
+            self._seq += 1
+            self._pending.append((self._seq, line))
+
+    def _accept_loop(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.settimeout(5.0)  # Drop viewers that stop reading
+            # Step events are emitted under the tracker lock, so holding it
+            # makes the snapshot and the start of this viewer's stream line up
+            with self.tracker._lock:
+                state = {"event": "state", **self.tracker.snapshot(full=True)}
+                with self._lock:
+                    greeting = json.dumps(state, default=json_default).encode() + b"\n"
+                    self._viewers.append(_Viewer(conn, self._seq, greeting))
+
+    def _send_loop(self):
+        while not self._stop.wait(self.send_interval):
+            if self._viewers:
+                # Counter handles emit nothing on add(); send their progress too
+                self.tracker.emit_counters()
+            self._send_pending()
+        self._send_pending()
+
+    def _send_pending(self):
+        with self._lock:
+            pending, self._pending = self._pending, []
+            viewers = list(self._viewers)
+        for viewer in viewers:
+            data = viewer.greeting + b"".join(
+                line for seq, line in pending if seq > viewer.start_seq)
+            viewer.greeting = b""
+            if not data:
+                continue
+            try:
+                viewer.conn.sendall(data)
+            except OSError:  # Viewer went away or stopped reading
+                self._drop(viewer)
+
+    def _drop(self, viewer):
+        with self._lock:
+            self._viewers.remove(viewer)
+        viewer.conn.close()
+
+    def close(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        for viewer in list(self._viewers):
+            self._drop(viewer)
+        self._server.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+def view(path):
+    """Render the status panel of the job publishing on path until it exits"""
+    from rich import print
+    from richtest6 import StatusTracker
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(path)
+        with sock.makefile("r", encoding="utf-8") as lines, \
+                StatusTracker(mode="rich") as status:
+            for line in lines:
+                record = json.loads(line)
+                if record["event"] == "state":
+                    status.load_snapshot(record)
+                else:
+                    apply_event(status, record)
+    print("[bold]Job finished[/bold]")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a running job's status")
+    parser.add_argument("socket_path", nargs="?", default="/tmp/richtest.sock")
+    args = parser.parse_args()
+    try:
+        view(args.socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        raise SystemExit(f"No job is publishing on {args.socket_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+import argparse
+import hashlib
+import inspect
+import os
+import pickle
+
+import pandas as pd
+
+DEFAULT_CACHE_DIR = ".step_cache"
+
+
+def _hash_value(h, value):
+    """Feed a step input into the hash, hashing DataFrames by content"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        if isinstance(value, pd.DataFrame):
+            h.update(repr(list(value.columns)).encode())
+            h.update(repr(list(value.dtypes)).encode())
+        else:
+            h.update(repr((value.name, value.dtype)).encode())
+        h.update(pd.util.hash_pandas_object(value, index=True).values.tobytes())
+    elif isinstance(value, dict):
+        h.update(b"dict")
+        for key, item in value.items():
+            _hash_value(h, key)
+            _hash_value(h, item)
+    elif isinstance(value, (list, tuple)):
+        h.update(type(value).__name__.encode())
+        for item in value:
+            _hash_value(h, item)
+    else:
+        h.update(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+class StepCache:
+    """On-disk cache of step results that persists between runs.
+
+    Results are keyed by a hash of the step name, the source of the step
+    function and its inputs, so editing a step or feeding it different data
+    misses the cache. Code the step calls is not part of the key; clear the
+    cache after changing it. The least recently used entries are evicted once
+    the cache grows beyond `max_size_mb`.
+    """
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_size_mb=1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size_mb * 1024**2
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, step_name, func, inputs=()):
+        h = hashlib.sha256()
+        h.update(step_name.encode())
+        try:
+            h.update(inspect.getsource(func).encode())
+        except (OSError, TypeError):
+            h.update(func.__code__.co_code)
+        for value in inputs:
+            _hash_value(h, value)
+        return h.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key):
+        """Return (True, result) for a cached key, otherwise (False, None)"""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return False, None
+        os.utime(path)  # Mark as recently used for eviction
+        self.hits += 1
+        return True, value
+
+    def put(self, key, value):
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)  # Never leave a half-written entry behind
+        self.evict()
+
+    def entries(self):
+        """Return (path, size, mtime) of every entry, least recently used first"""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".pkl"):
+                stat = os.stat(os.path.join(self.cache_dir, name))
+                entries.append((os.path.join(self.cache_dir, name),
+                                stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits max_size"""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= self.max_size:
+                break
+            os.remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove every entry; returns the number removed"""
+        entries = self.entries()
+        for path, _, _ in entries:
+            os.remove(path)
+        return len(entries)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Manage the step result cache")
+    parser.add_argument("command", choices=["info", "clear"])
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.cache_dir):
+        print(f"No cache at {args.cache_dir}")
+        return
+    cache = StepCache(args.cache_dir)
+    if args.command == "clear":
+        print(f"Removed {cache.clear()} cached results from {args.cache_dir}")
+    else:
+        entries = cache.entries()
+        total = sum(size for _, size, _ in entries)
+        print(f"{len(entries)} cached results, {total / 1024**2:.1f}MB in {args.cache_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import numbers
+
+
+def _compile(fmt):
+    """Turn a "{value...}" template into a formatter; callables are used as-is"""
+    if callable(fmt):
+        return fmt
+    template = fmt.format
+    return lambda value: template(value=value)
+
+
+# Plain text formats, as used by the richtest6 panel
+PLAIN_FORMATS = {
+    "lines_processed": "{value:,} lines",
+    "records_found": "{value:,} records",
+    "output_file": "saved to {value}",
+    "files_created": "{value} files created",
+    "notifications_sent": "{value} notifications sent",
+    "errors_found": "{value} errors found",
+    "processing_time": "{value:.2f}s",
+    "dataframe_shape": "df: {value[0]}×{value[1]}",
+    "dataframe_memory": "{value:.1f}MB",
+    "memory_before": "{value:.2f}MB before",
+    "memory_after": "{value:.2f}MB after",
+    "memory_reduction": "{value:.1f}x smaller",
+    "model_accuracy": "accuracy: {value:.2%}",
+    "cache_hit": lambda value: "cache hit",
+    "wall_time": "{value:.2f}s wall",
+    "cpu_time": "{value:.2f}s CPU",
+    "gc_collections": "{value} GCs",
+    "gc_pause": lambda value: f"{value * 1000:.1f}ms GC pause",
+}
+PLAIN_TYPE_FORMATS = {
+    bool: "{key}: {value}",
+    int: "{key}: {value:,}",
+    numbers.Integral: "{key}: {value:,}",  # numpy integers, which don't subclass int
+    float: "{key}: {value:,.3f}",
+}
+
+# Rich markup formats, as used by the richtest5 panel
+MARKUP_FORMATS = {
+    "lines_processed": "[green]{value:,}[/green] lines",
+    "records_found": "[green]{value:,}[/green] records",
+    "output_file": "saved to [green]{value}[/green]",
+    "files_created": "[green]{value}[/green] files created",
+    "notifications_sent": "[green]{value}[/green] notifications sent",
+    "errors_found": "[red]{value}[/red] errors found",
+    "processing_time": "[green]{value:.2f}[/green]s",
+    "wall_time": "[green]{value:.2f}[/green]s wall",
+    "cpu_time": "[green]{value:.2f}[/green]s CPU",
+    "gc_collections": "[green]{value}[/green] GCs",
+    "gc_pause": lambda value: f"[green]{value * 1000:.1f}[/green]ms GC pause",
+}
+MARKUP_TYPE_FORMATS = {
+    bool: "{key}: [green]{value}[/green]",
+    int: "{key}: [green]{value:,}[/green]",
+    numbers.Integral: "{key}: [green]{value:,}[/green]",
+    float: "{key}: [green]{value:,.3f}[/green]",
+}
+
+
+class StepDataFormatter:
+    """Formats step data through a table of per-key formatters.
+
+    Keys are looked up in the key table first, then by the value's type
+    (walking its MRO, so e.g. numpy.float64 matches float, then checking
+    abstract types such as numbers.Integral), and otherwise fall back to
+    `default`. The last formatted string is cached per key for immutable
+    values (numbers, strings and tuples of them), so values that haven't
+    changed since the previous frame are not formatted again.
+    """
+
+    def __init__(self, key_formats, type_formats=None, default="{key}: {value}"):
+        self._key_formatters = {key: _compile(fmt)
+                                for key, fmt in key_formats.items()}
+        self._type_formats = {}
+        self._default = default.format
+        self._cache = {}  # key -> (last value, formatted string)
+        for value_type, fmt in (type_formats or {}).items():
+            self.register_type(value_type, fmt)
+
+    def register(self, key, fmt):
+        """Use a "{value...}" template or callable(value) for one key"""
+        self._key_formatters[key] = _compile(fmt)
+        self._cache.pop(key, None)
+
+    def register_type(self, value_type, fmt):
+        """Use a "{key}...{value}" template or callable(key, value) for a value type"""
+        self._type_formats[value_type] = fmt if callable(fmt) else fmt.format
+        self._cache.clear()
+
+    def _format_uncached(self, key, value):
+        formatter = self._key_formatters.get(key)
+        if formatter is not None:
+            return formatter(value)
+        for value_type in type(value).__mro__:
+            type_formatter = self._type_formats.get(value_type)
+            if type_formatter is not None:
+                return type_formatter(key=key, value=value)
+        for value_type, type_formatter in self._type_formats.items():
+            if isinstance(value, value_type):
+                return type_formatter(key=key, value=value)
+        return self._default(key=key, value=value)
+
+    def format_value(self, key, value):
+        if not _immutable(value):
+            # A list or dict may have changed in place since it was cached
+            return self._format_uncached(key, value)
+        cached = self._cache.get(key)
+        if cached is not None:
+            previous, formatted = cached
+            if type(previous) is type(value) and previous == value:
+                return formatted
+        formatted = self._format_uncached(key, value)
+        self._cache[key] = (value, formatted)
+        return formatted
+
+    def format(self, data):
+        """Format a step's data dict into one comma-separated line"""
+        if not data:
+            return ""
+        return ", ".join(self.format_value(key, value)
+                         for key, value in data.items())
+
+
+def _immutable(value):
+    if isinstance(value, tuple):
+        return all(_immutable(item) for item in value)
+    return value is None or isinstance(value, (numbers.Number, str, bytes))
+
+
+def plain_formatter():
+    return StepDataFormatter(PLAIN_FORMATS, PLAIN_TYPE_FORMATS)
+
+
+def markup_formatter():
+    return StepDataFormatter(MARKUP_FORMATS, MARKUP_TYPE_FORMATS,
+                             default="{key}: [green]{value}[/green]")
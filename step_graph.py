@@ -0,0 +1,94 @@
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+import logging
+
+log = logging.getLogger("rich")
+
+
+class GraphStep:
+    """A named step function and the names of the steps it takes results from"""
+
+    def __init__(self, name, func, inputs=()):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+
+
+class StepStatus:
+    """A StatusTracker bound to one step, handed to each step run by run_graph
+
+    update_step_data, add_step_data, counter and set_step_total go to the
+    bound step instead of the tracker's current_step, so steps running at
+    the same time don't mix their data or progress.
+    Everything else is passed through to the tracker.
+    """
+
+    def __init__(self, tracker, step_name):
+        self._tracker = tracker
+        self.step_name = step_name
+
+    def update_step_data(self, **data):
+        self._tracker.update_step_data(step_name=self.step_name, **data)
+
+    def add_step_data(self, **increments):
+        self._tracker.add_step_data(step_name=self.step_name, **increments)
+
+    def counter(self, key):
+        return self._tracker.counter(key, step_name=self.step_name)
+
+    def set_step_total(self, counter, total):
+        self._tracker.set_step_total(counter, total, step_name=self.step_name)
+
+    def __getattr__(self, name):
+        return getattr(self._tracker, name)
+
+
+def run_graph(status, steps, max_workers=4):
+    """Run each step as soon as its inputs are ready, independent steps in parallel
+
+    Each step function is called as func(step_status, *input_results) on a
+    thread pool. Once a step fails no new steps are started, but the ones
+    already running are allowed to finish. Returns the results of the
+    completed steps by name.
+    """
+    pending = {step.name: step for step in steps}
+    for step in steps:
+        missing = [name for name in step.inputs if name not in pending]
+        if missing:
+            raise ValueError(
+                f"Step {step.name!r} depends on unknown steps: {', '.join(missing)}")
+
+    results = {}
+    running = {}  # Future -> step name
+    failed = False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            if not failed:
+                for name, step in list(pending.items()):
+                    if all(input_name in results for input_name in step.inputs):
+                        del pending[name]
+                        status.start_step(name)
+                        future = pool.submit(
+                            step.func, StepStatus(status, name),
+                            *[results[input_name] for input_name in step.inputs])
+                        running[future] = name
+
+            if not running:
+                if pending and not failed:
+                    raise ValueError(
+                        f"Steps with circular dependencies: {', '.join(pending)}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    log.error(f"Error in {name}: {e}")
+                    status.add_error(step_name=name)
+                    failed = True
+                else:
+                    results[name] = status.complete_step(name, result=result)
+
+    return results
@@ -0,0 +1,62 @@
+from collections import deque
+
+
+class StepHistory:
+    """Fixed-size display history of completed steps with running totals.
+
+    Only the last `capacity` completion lines are kept in memory, so memory
+    stays constant however many steps run. Every line can optionally be
+    streamed to `history_file` if the full history is wanted.
+    """
+
+    def __init__(self, capacity=5, history_file=None):
+        self.lines = deque(maxlen=capacity)
+        self.completed = 0
+        self.failed = 0
+        self.total_time = 0.0
+        self._rendered = None  # Cached text of the visible block, reset on change
+        self._history_file = open(
+            history_file, "a", encoding="utf-8") if history_file else None
+
+    def __len__(self):
+        return self.completed
+
+    def __bool__(self):
+        return self.completed > 0
+
+    def add(self, line, processing_time=None):
+        """Record a completed step and its pre-rendered display line"""
+        self.lines.append(line)
+        self.completed += 1
+        if processing_time is not None:
+            self.total_time += processing_time
+        self._rendered = None
+        if self._history_file:
+            self._history_file.write(line + "\n")
+
+    def load(self, lines, completed, failed=0, total_time=0.0):
+        """Take over the visible lines and totals of another history"""
+        self.lines.clear()
+        self.lines.extend(lines)
+        self.completed = completed
+        self.failed = failed
+        self.total_time = total_time
+        self._rendered = None
+
+    def add_failure(self):
+        self.failed += 1
+
+    def render(self):
+        """Return the completed steps block, rebuilt only after a new step"""
+        if self._rendered is None:
+            parts = ["Completed Steps:", *self.lines]
+            hidden = self.completed - len(self.lines)
+            if hidden > 0:
+                parts.append(f"... and {hidden} more")
+            self._rendered = "\n".join(parts)
+        return self._rendered
+
+    def close(self):
+        if self._history_file:
+            self._history_file.close()
+            self._history_file = None
@@ -0,0 +1,139 @@
+"""Structured journal of StatusTracker events, and a tool to replay it.
+
+Every step event (start, update, complete, error...) is appended to a
+JSON-lines file, one object per line, so a run can be inspected or
+replayed afterwards without re-running it. Each run starts with a "run"
+event; the file is appended to, so it can hold several runs.
+
+    python step_journal.py replay step_journal.jsonl --speed 10
+"""
+import argparse
+import json
+import os
+import threading
+import time
+
+from headless_backend import json_default
+
+
+class StepJournal:
+    """Appends event records to a JSON-lines file in batches.
+
+    Records are buffered and written once `batch_size` are pending or
+    `flush_interval` seconds have passed since the last write, so frequent
+    step data updates don't each cost a write.
+    """
+
+    def __init__(self, path="step_journal.jsonl", batch_size=512, flush_interval=1.0):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._file = open(path, "a", encoding="utf-8")
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        self.event({"event": "run", "time": time.time(), "pid": os.getpid()})
+
+    def event(self, record):
+        line = json.dumps(record, default=json_default, separators=(",", ":"))
+        with self._lock:
+            self._buffer.append(line)
+            if (len(self._buffer) >= self.batch_size
+                    or time.monotonic() - self._last_flush >= self.flush_interval):
+                self._flush()
+
+    def flush(self):
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if self._buffer and not self._file.closed:
+            self._file.write("\n".join(self._buffer) + "\n")
+            self._file.flush()
+            self._buffer.clear()
+        self._last_flush = time.monotonic()
+
+    def close(self):
+        with self._lock:
+            self._flush()
+            self._file.close()
+
+
+def read_runs(path):
+    """Return the journal's events as a list of runs, each a list of records"""
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # A line cut short by a crash
+            if record["event"] == "run" or not runs:
+                runs.append([])
+            runs[-1].append(record)
+    return runs
+
+
+def apply_event(status, record):
+    """Apply one recorded event to a StatusTracker through its public methods"""
+    event = record["event"]
+    if event == "total_steps":
+        status.set_total_steps(record["total"])
+    elif event == "start":
+        status.start_step(record["step"])
+    elif event == "update":
+        status.update_step_data(record["step"], **record["data"])
+    elif event == "add":
+        status.add_step_data(record["step"], **record["data"])
+    elif event == "complete":
+        # The recorded metrics (wall_time...) override the ones measured
+        # during replay, in the step data as well as in totals and hot step
+        status.complete_step(record["step"], **record["data"])
+    elif event == "error":
+        status.add_error(record["step"])
+
+
+def replay(events, speed=1.0):
+    """Play recorded events back through a live StatusTracker panel.
+
+    speed multiplies the recorded pace; 0 replays as fast as possible.
+    """
+    from richtest6 import StatusTracker
+
+    previous_time = None
+    with StatusTracker(mode="rich") as status:
+        for record in events:
+            if speed > 0 and previous_time is not None:
+                time.sleep(max(0.0, record["time"] - previous_time) / speed)
+            previous_time = record["time"]
+            apply_event(status, record)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a step event journal")
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    replay_parser = subcommands.add_parser(
+        "replay", help="replay a run through the status panel")
+    replay_parser.add_argument("journal", nargs="?", default="step_journal.jsonl")
+    replay_parser.add_argument("--run", type=int, default=-1,
+                               help="which run in the journal (default: the last)")
+    replay_parser.add_argument("--speed", type=float, default=1.0,
+                               help="playback speed multiplier, 0 for no delays")
+    subcommands.add_parser("runs", help="list the runs in a journal").add_argument(
+        "journal", nargs="?", default="step_journal.jsonl")
+    args = parser.parse_args()
+
+    runs = read_runs(args.journal)
+    if args.command == "runs":
+        for index, events in enumerate(runs):
+            started = time.strftime("%Y-%m-%d %H:%M:%S",
+                                    time.localtime(events[0]["time"]))
+            duration = events[-1]["time"] - events[0]["time"]
+            steps = sum(record["event"] == "start" for record in events)
+            print(f"{index}: {started}, {steps} steps, {duration:.1f}s")
+    else:
+        replay(runs[args.run], speed=args.speed)
+
+
+if __name__ == "__main__":
+    main()
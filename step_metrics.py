@@ -0,0 +1,92 @@
+import gc
+import threading
+import time
+
+
+class _GCMonitor:
+    """Counts garbage collections and the time spent in them, process-wide"""
+
+    def __init__(self):
+        self.collections = 0
+        self.pause = 0.0
+        self._started = {}  # Thread id -> start time of the running collection
+        gc.callbacks.append(self._callback)
+
+    def _callback(self, phase, info):
+        if phase == "start":
+            self._started[threading.get_ident()] = time.perf_counter()
+        else:
+            started = self._started.pop(threading.get_ident(), None)
+            self.collections += 1
+            if started is not None:
+                self.pause += time.perf_counter() - started
+
+
+_gc_monitor = _GCMonitor()
+
+
+class StepTimer:
+    """Measures wall time, process CPU time and GC activity of one step.
+
+    CPU time and GC figures are for the whole process, so steps running at
+    the same time share them.
+    """
+
+    def __init__(self):
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self._collections = _gc_monitor.collections
+        self._pause = _gc_monitor.pause
+
+    def elapsed(self):
+        return time.perf_counter() - self._wall
+
+    def stop(self):
+        """Return the metrics accumulated since the timer was created"""
+        return {
+            "wall_time": time.perf_counter() - self._wall,
+            "cpu_time": time.process_time() - self._cpu,
+            "gc_collections": _gc_monitor.collections - self._collections,
+            "gc_pause": _gc_monitor.pause - self._pause,
+        }
+
+
+class StepMetrics:
+    """Metrics of finished steps, in constant memory however many steps run.
+
+    Only the last `capacity` steps' metrics are kept, plus the step with the
+    highest value of each metric so far, so hot() needs no scan.
+    """
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self.recent = {}  # Step name -> metrics, oldest first
+        self.hot_steps = {}  # Metric -> (step name, value)
+
+    def __len__(self):
+        return len(self.recent)
+
+    def __contains__(self, step_name):
+        return step_name in self.recent
+
+    def __getitem__(self, step_name):
+        return self.recent[step_name]
+
+    def add(self, step_name, metrics):
+        self.recent.pop(step_name, None)
+        self.recent[step_name] = metrics
+        if len(self.recent) > self.capacity:
+            del self.recent[next(iter(self.recent))]
+        for metric, value in metrics.items():
+            hot = self.hot_steps.get(metric)
+            if hot is None or value > hot[1]:
+                self.hot_steps[metric] = (step_name, value)
+
+    def hot(self, metric="wall_time"):
+        """Return (step name, value) of the finished step with the highest metric"""
+        return self.hot_steps.get(metric, (None, None))
+
+    def load(self, recent, hot_steps):
+        """Take over the recent metrics and hot steps of another tracker"""
+        self.recent = dict(recent)
+        self.hot_steps = {metric: tuple(hot) for metric, hot in hot_steps.items()}
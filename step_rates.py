@@ -0,0 +1,111 @@
+import time
+
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{seconds % 3600 // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+class RateEstimator:
+    """Exponentially weighted moving average of a counter's rate per second.
+
+    sample() is O(1) and is meant to be called on render ticks, not on
+    every counter update. The weight of older samples halves every
+    `half_life` seconds, whatever the tick rate.
+    """
+
+    def __init__(self, half_life=3.0, min_interval=0.2):
+        self.half_life = half_life
+        self.min_interval = min_interval  # Shorter gaps are too noisy to sample
+        self.rate = None
+        self._value = 0
+        self._time = time.monotonic()
+
+    def sample(self, value, now=None):
+        """Feed the counter's current value and return the estimated rate"""
+        now = time.monotonic() if now is None else now
+        elapsed = now - self._time
+        if elapsed >= self.min_interval:
+            instant = (value - self._value) / elapsed
+            if self.rate is None:
+                self.rate = instant
+            else:
+                alpha = 1 - 0.5 ** (elapsed / self.half_life)
+                self.rate += alpha * (instant - self.rate)
+            self._value = value
+            self._time = now
+        return self.rate
+
+
+class StepProgress:
+    """Expected totals of step counters, with rates and ETAs worked out at render time
+
+    A counter expected with total=None only gets its rate estimated.
+    """
+
+    def __init__(self, half_life=3.0):
+        self.half_life = half_life
+        self._totals = {}  # step name -> {counter: (expected total, RateEstimator)}
+
+    def expect(self, step_name, counter, total=None):
+        self._totals.setdefault(step_name, {})[counter] = (
+            total, RateEstimator(self.half_life))
+
+    def forget(self, step_name):
+        self._totals.pop(step_name, None)
+
+    def estimate(self, step_name, data):
+        """Return [(counter, value, total, rate, seconds left)] for a step's counters.
+
+        Rate and seconds left are None until there is enough to estimate
+        from; seconds left is always None for a counter without a total.
+        """
+        estimates = []
+        for counter, (total, rate_estimator) in self._totals.get(step_name, {}).items():
+            value = data.get(counter, 0)
+            rate = rate_estimator.sample(value)
+            remaining = (max(total - value, 0) / rate
+                         if rate and total is not None else None)
+            estimates.append((counter, value, total, rate, remaining))
+        return estimates
+
+    def remaining(self, estimates):
+        """Seconds until a step is done: its slowest counter, or None if unknown"""
+        times = [remaining for *_, remaining in estimates]
+        if not times or None in times:
+            return None
+        return max(times)
+
+    def format(self, estimates):
+        """Format estimates as "counter: value/total (pct) at rate/s, ETA" parts"""
+        parts = []
+        for counter, value, total, rate, remaining in estimates:
+            if total is None:
+                text = f"{counter}: {value:,}"
+            else:
+                text = f"{counter}: {value:,}/{total:,} ({value / total if total else 1:.0%})"
+            if rate is not None:
+                text += f" at {rate:,.0f}/s"
+            if remaining is not None:
+                text += f", {format_duration(remaining)} left"
+            parts.append(text)
+        return ", ".join(parts)
+
+
+def run_remaining(step_remaining, total_steps, completed, running, step_time):
+    """Estimate seconds left in the run, or None.
+
+    Steps not started yet are assumed to take as long as the average
+    completed step.
+    """
+    if step_remaining is None:
+        return None
+    not_started = max(total_steps - completed - running, 0)
+    if not_started and not completed:
+        return None
+    average = step_time / completed if completed else 0.0
+    return step_remaining + not_started * average